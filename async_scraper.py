@@ -0,0 +1,220 @@
+import asyncio
+from typing import List, Dict, Optional
+from tenacity import retry, stop_after_attempt, wait_exponential
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from checkpoint import FetchCheckpoint
+from export import JSONLExporter
+from github_scraper import GitHubScraper
+from utils import create_progress_spinner, print_warning
+
+
+class AsyncGitHubScraper(GitHubScraper):
+    """Scrape GitHub issues and comments on a single asyncio event loop."""
+    
+    # The event loop can only be driven from one thread at a time, so neither the
+    # pipeline's worker threads nor concurrent repositories can share it
+    supports_pipeline = False
+    supports_concurrent_repos = False
+    
+    def __init__(self, github_token: Optional[str] = None, comment_workers: int = 8,
+                 cache_dir: Optional[str] = None, cache_max_bytes: int = 256 * 1024 * 1024,
+                 page_workers: int = 4, github_tokens: Optional[List[str]] = None,
+                 requests_per_second: float = 15.0, max_comments_per_issue: Optional[int] = None,
+                 store_path: Optional[str] = None, repo_workers: int = 1):
+        if httpx is None:
+            raise ImportError("httpx library not installed. Run: pip install httpx")
+        
+        super().__init__(
+            github_token=github_token,
+            comment_workers=comment_workers,
+            cache_dir=cache_dir,
+            cache_max_bytes=cache_max_bytes,
+            page_workers=page_workers,
+            github_tokens=github_tokens,
+            requests_per_second=requests_per_second,
+            max_comments_per_issue=max_comments_per_issue,
+            store_path=store_path,
+            repo_workers=repo_workers
+        )
+        
+        # One loop and one connection pool, reused for every repository this instance scrapes
+        self._loop = asyncio.new_event_loop()
+        self.client = httpx.AsyncClient(
+            headers=dict(self.session.headers),
+            limits=httpx.Limits(max_connections=max(self.comment_workers, self.page_workers)),
+            timeout=30.0
+        )
+    
+    def _run(self, coro):
+        """Run a coroutine to completion on the scraper's event loop."""
+        return self._loop.run_until_complete(coro)
+    
+    def _cached_response(self, entry: Dict, response: 'httpx.Response') -> 'httpx.Response':
+        """Rebuild a full response from a cache entry after a 304 Not Modified."""
+        headers = httpx.Headers(entry['headers'])
+        headers.update({k: v for k, v in response.headers.items() if k.lower() != 'content-length'})
+        return httpx.Response(200, headers=headers, content=entry['body'], request=response.request)
+    
+    async def _acquire_token_async(self, resource: str = 'core') -> str:
+        """Wait until the scheduler allows another request and return the token to send it with."""
+        while True:
+            token, sleep_time = self.scheduler.acquire(resource)
+            if token:
+                return token
+            if sleep_time >= 10:
+                print_warning(f"Rate limit nearly exhausted. Waiting {int(sleep_time)} seconds...")
+            await asyncio.sleep(sleep_time)
+    
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10), reraise=True)
+    async def _make_request_async(self, url: str, params: Optional[Dict] = None) -> 'httpx.Response':
+        """Make API request with retry logic."""
+        key, entry, headers = self._cache_lookup(url, params)
+        token = await self._acquire_token_async()
+        headers['Authorization'] = f'token {token}'
+        
+        try:
+            response = await self.client.get(url, params=params, headers=headers)
+        except httpx.HTTPError:
+            self.scheduler.release(token)
+            raise
+        self.scheduler.release(token, headers=response.headers)
+        
+        if self._is_rate_limited(response):
+            # The pool now knows this token is exhausted, so the retry goes to another one
+            return await self._make_request_async(url, params)
+        
+        if entry and response.status_code == 304:
+            return self._cached_response(entry, response)
+        
+        response.raise_for_status()
+        
+        if self.cache:
+            self.cache.store(key, response.headers, response.content)
+        
+        return response
+    
+    async def fetch_issues_async(self, owner: str, repo: str, max_issues: Optional[int] = None,
+                                 since: Optional[str] = None,
+                                 checkpoint: Optional[FetchCheckpoint] = None,
+                                 exporter: Optional[JSONLExporter] = None) -> List[Dict]:
+        """Fetch all open issues from a repository, or every issue updated since a timestamp."""
+        url = f"{self.base_url}/repos/{owner}/{repo}/issues"
+        issues = []
+        seen = set()
+        per_page = 100
+        next_page, last_page, has_next = self._restore_issues_pages(checkpoint, issues, seen)
+        semaphore = asyncio.Semaphore(self.page_workers)
+        
+        async def fetch_page(page: int) -> 'httpx.Response':
+            async with semaphore:
+                return await self._make_request_async(url, self._issues_params(page, per_page, since))
+        
+        with create_progress_spinner("Fetching issues...") as progress:
+            task = progress.add_task("Fetching issues...", total=None)
+            
+            while has_next and not (max_issues and len(issues) >= max_issues):
+                pages = self._plan_issue_pages(next_page, last_page, len(issues), max_issues, per_page)
+                next_page = pages[-1] + 1
+                
+                # Keep every page that arrived before the first failure, in request order
+                results = await asyncio.gather(*(fetch_page(page) for page in pages), return_exceptions=True)
+                
+                for page, result in zip(pages, results):
+                    if isinstance(result, httpx.HTTPError):
+                        self._listing_error(f"Error fetching issues: {result}")
+                        has_next = False
+                        break
+                    if isinstance(result, BaseException):
+                        raise result
+                    
+                    has_next, last_page = self._record_issues_page(
+                        page, result, issues, seen, per_page, last_page, checkpoint, exporter
+                    )
+                    progress.update(task, description=f"Fetched {len(issues)} issues...")
+        
+        return issues[:max_issues] if max_issues else issues
+    
+    async def fetch_comments_async(self, owner: str, repo: str, issue_number: int) -> List[Dict]:
+        """Fetch all comments for a specific issue (up to max_comments_per_issue); none if the fetch fails."""
+        comments = await self.try_fetch_comments_async(owner, repo, issue_number)
+        return comments if comments is not None else []
+    
+    async def try_fetch_comments_async(self, owner: str, repo: str, issue_number: int) -> Optional[List[Dict]]:
+        """Fetch an issue's comments, or return None if the fetch failed."""
+        url = f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}/comments"
+        limit = self.max_comments_per_issue
+        per_page = min(100, limit) if limit else 100
+        semaphore = asyncio.Semaphore(self.page_workers)
+        
+        async def fetch_page(page: int) -> 'httpx.Response':
+            async with semaphore:
+                return await self._make_request_async(url, {'per_page': per_page, 'page': page})
+        
+        try:
+            response = await fetch_page(1)
+            comments = response.json()
+            
+            # Long threads: fetch the remaining pages concurrently, keeping them in order
+            pages = self._comment_pages(response, per_page)
+            for page_response in await asyncio.gather(*(fetch_page(page) for page in pages)):
+                comments.extend(page_response.json())
+        except httpx.HTTPError as e:
+            print_warning(f"Error fetching comments for issue #{issue_number}: {e}")
+            return None
+        
+        return comments[:limit] if limit else comments
+    
+    async def prefetch_comments_async(self, owner: str, repo: str, issues: List[Dict],
+                                      checkpoint: Optional[FetchCheckpoint] = None,
+                                      exporter: Optional[JSONLExporter] = None) -> Dict[int, List[Dict]]:
+        """Fetch comments for all commented issues, at most comment_workers at a time."""
+        numbers = [issue['number'] for issue in issues if issue.get('comments', 0) > 0]
+        comments_by_issue = self._restore_comments(checkpoint, numbers)
+        pending = [number for number in numbers if number not in comments_by_issue]
+        
+        if not pending:
+            return comments_by_issue
+        
+        semaphore = asyncio.Semaphore(self.comment_workers)
+        
+        with create_progress_spinner("Fetching comments...") as progress:
+            task = progress.add_task("Fetching comments...", total=len(numbers), completed=len(comments_by_issue))
+            
+            async def fetch(number: int):
+                async with semaphore:
+                    comments = await self.try_fetch_comments_async(owner, repo, number)
+                comments_by_issue[number] = self.record_comments(number, comments, checkpoint, exporter)
+                progress.update(
+                    task, advance=1,
+                    description=f"Fetched comments for {len(comments_by_issue)}/{len(numbers)} issues..."
+                )
+            
+            await asyncio.gather(*(fetch(number) for number in pending))
+        
+        return comments_by_issue
+    
+    # Synchronous entry points used by save_issues and the CLI
+    def fetch_issues(self, owner: str, repo: str, max_issues: Optional[int] = None,
+                     since: Optional[str] = None,
+                     checkpoint: Optional[FetchCheckpoint] = None,
+                     exporter: Optional[JSONLExporter] = None) -> List[Dict]:
+        return self._run(self.fetch_issues_async(owner, repo, max_issues, since, checkpoint, exporter))
+    
+    def try_fetch_comments(self, owner: str, repo: str, issue_number: int) -> Optional[List[Dict]]:
+        return self._run(self.try_fetch_comments_async(owner, repo, issue_number))
+    
+    def prefetch_comments(self, owner: str, repo: str, issues: List[Dict],
+                          checkpoint: Optional[FetchCheckpoint] = None,
+                          exporter: Optional[JSONLExporter] = None) -> Dict[int, List[Dict]]:
+        return self._run(self.prefetch_comments_async(owner, repo, issues, checkpoint, exporter))
+    
+    def close(self):
+        """Close the connection pool and event loop."""
+        self._run(self.client.aclose())
+        self._loop.close()
+        super().close()
\ No newline at end of file
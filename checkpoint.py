@@ -0,0 +1,90 @@
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+class FetchCheckpoint:
+    """Persist fetched issue pages and comments as they arrive so an interrupted fetch can resume."""
+    
+    def __init__(self, directory: str, params: Dict[str, Any]):
+        self.path = Path(directory)
+        self.params = params
+        self._lock = threading.Lock()
+    
+    def start(self, resume: bool = False) -> bool:
+        """Prepare for a fetch; returns True if earlier progress with the same parameters is kept."""
+        meta_path = self.path / 'meta.json'
+        
+        if resume and meta_path.exists():
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                if json.load(f) == self.params:
+                    return True
+        
+        self.clear()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._write_json(meta_path, self.params)
+        return False
+    
+    def _write_json(self, path: Path, data: Any):
+        """Write JSON atomically so a crash never leaves a half-written file behind."""
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    
+    def save_page(self, page: int, data: Dict):
+        """Record a fetched page of issues."""
+        self._write_json(self.path / f"page_{page:05d}.json", data)
+    
+    def load_pages(self) -> List[Dict]:
+        """Return the pages completed so far, stopping at the first gap."""
+        pages = []
+        page = 1
+        
+        while True:
+            path = self.path / f"page_{page:05d}.json"
+            if not path.exists():
+                break
+            with open(path, 'r', encoding='utf-8') as f:
+                pages.append(json.load(f))
+            page += 1
+        
+        return pages
+    
+    def save_comments(self, issue_number: int, comments: List[Dict]):
+        """Append the comments fetched for one issue."""
+        line = json.dumps({'number': issue_number, 'comments': comments})
+        with self._lock:
+            with open(self.path / 'comments.jsonl', 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+    
+    def load_comments(self) -> Dict[int, List[Dict]]:
+        """Return the comments fetched so far, keyed by issue number."""
+        path = self.path / 'comments.jsonl'
+        comments_by_issue = {}
+        if not path.exists():
+            return comments_by_issue
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # The run died mid-write; that issue is simply fetched again
+                    continue
+                comments_by_issue[record['number']] = record['comments']
+        
+        return comments_by_issue
+    
+    def clear(self):
+        """Remove the checkpoint once the fetch it tracks is complete."""
+        shutil.rmtree(self.path, ignore_errors=True)
+        
+        # Other repositories' checkpoints may still be in the shared directory
+        try:
+            self.path.parent.rmdir()
+        except OSError:
+            pass
\ No newline at end of file
@@ -0,0 +1,148 @@
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+from utils import create_output_dir, get_repo_filename
+
+# Rows per Parquet row group: large enough for fast scans, small enough to write in bounded memory
+PARQUET_ROW_GROUP = 50000
+
+
+class JSONLExporter:
+    """Append raw issue and comment JSON to newline-delimited files as each page arrives."""
+    
+    def __init__(self, output_dir: str, owner: str, repo: str):
+        path = Path(output_dir)
+        self.output_dir = output_dir
+        self.issues_path = path / f"{get_repo_filename(owner, repo, 'issues')}.jsonl"
+        self.comments_path = path / f"{get_repo_filename(owner, repo, 'comments')}.jsonl"
+        self._lock = threading.Lock()
+        self._issues_file = None
+        self._comments_file = None
+    
+    def start(self, resume: bool = False):
+        """Open the export files, keeping what an interrupted run already wrote when resuming."""
+        create_output_dir(self.output_dir)
+        mode = 'a' if resume else 'w'
+        self._issues_file = open(self.issues_path, mode, encoding='utf-8')
+        self._comments_file = open(self.comments_path, mode, encoding='utf-8')
+    
+    def _write(self, f, records: List[Dict]):
+        if not records:
+            return
+        lines = ''.join(json.dumps(record) + '\n' for record in records)
+        with self._lock:
+            f.write(lines)
+            f.flush()
+    
+    def write_issues(self, issues: List[Dict]):
+        """Append one page of issues."""
+        self._write(self._issues_file, issues)
+    
+    def write_comments(self, issue_number: int, comments: List[Dict]):
+        """Append comments fetched for one issue, tagged with its number."""
+        self._write(self._comments_file, [dict(comment, issue_number=issue_number) for comment in comments])
+    
+    def close(self):
+        """Close the export files."""
+        for f in (self._issues_file, self._comments_file):
+            if f:
+                f.close()
+
+
+def _timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a GitHub ISO 8601 timestamp."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00')) if value else None
+
+
+class ParquetExporter:
+    """Write issues and comments to typed, columnar Parquet files for dataframe and SQL engines."""
+    
+    def __init__(self, output_dir: str, owner: str, repo: str):
+        if pa is None:
+            raise ImportError("pyarrow library not installed. Run: pip install pyarrow")
+        
+        path = Path(output_dir)
+        self.output_dir = output_dir
+        self.repo = f"{owner}/{repo}"
+        self.issues_path = path / f"{get_repo_filename(owner, repo, 'issues')}.parquet"
+        self.comments_path = path / f"{get_repo_filename(owner, repo, 'comments')}.parquet"
+        
+        timestamp = pa.timestamp('s', tz='UTC')
+        self.issues_schema = pa.schema([
+            ('repo', pa.string()),
+            ('number', pa.int64()),
+            ('title', pa.string()),
+            ('body', pa.string()),
+            ('state', pa.string()),
+            ('author', pa.string()),
+            ('created_at', timestamp),
+            ('updated_at', timestamp),
+            ('labels', pa.list_(pa.string())),
+            ('assignees', pa.list_(pa.string())),
+            ('comment_count', pa.int32()),
+            ('html_url', pa.string())
+        ])
+        self.comments_schema = pa.schema([
+            ('repo', pa.string()),
+            ('issue_number', pa.int64()),
+            ('id', pa.int64()),
+            ('author', pa.string()),
+            ('body', pa.string()),
+            ('created_at', timestamp),
+            ('updated_at', timestamp)
+        ])
+    
+    def _write(self, path: Path, schema: 'pa.Schema', rows):
+        """Write rows to a Parquet file one row group at a time."""
+        with pq.ParquetWriter(str(path), schema, compression='zstd') as writer:
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= PARQUET_ROW_GROUP:
+                    writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                    batch = []
+            if batch:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+    
+    def write(self, issues: List[Dict], comments_by_issue: Optional[Dict[int, List[Dict]]] = None) -> List[str]:
+        """Export issues (and their comments, if fetched); returns the files written."""
+        create_output_dir(self.output_dir)
+        
+        self._write(self.issues_path, self.issues_schema, ({
+            'repo': self.repo,
+            'number': issue['number'],
+            'title': issue['title'],
+            'body': issue.get('body'),
+            'state': issue.get('state', 'open'),
+            'author': issue['user']['login'],
+            'created_at': _timestamp(issue['created_at']),
+            'updated_at': _timestamp(issue.get('updated_at')),
+            'labels': [label['name'] for label in issue.get('labels') or []],
+            'assignees': [assignee['login'] for assignee in issue.get('assignees') or []],
+            'comment_count': issue.get('comments', 0),
+            'html_url': issue.get('html_url')
+        } for issue in issues))
+        
+        if comments_by_issue is None:
+            return [str(self.issues_path)]
+        
+        self._write(self.comments_path, self.comments_schema, ({
+            'repo': self.repo,
+            'issue_number': number,
+            'id': comment.get('id'),
+            'author': comment['user']['login'],
+            'body': comment.get('body'),
+            'created_at': _timestamp(comment['created_at']),
+            'updated_at': _timestamp(comment.get('updated_at'))
+        } for issue in issues for number in [issue['number']] for comment in comments_by_issue.get(number, [])))
+        
+        return [str(self.issues_path), str(self.comments_path)]
\ No newline at end of file
@@ -1,215 +1,1139 @@
 import os
+import json
+import threading
 import time
-from typing import List, Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Iterator, Optional, Any, Tuple
 from pathlib import Path
+from urllib.parse import urlparse, parse_qs
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from tenacity import retry, stop_after_attempt, wait_exponential
 from dotenv import load_dotenv
 
+from checkpoint import FetchCheckpoint
+from export import JSONLExporter, ParquetExporter
+from http_cache import HTTPCache
+from issue_store import IssueStore
+from markdown_writer import MarkdownWriter
+from pipeline import IssuePipeline
+from rate_limit import TokenPool, RequestScheduler
 from utils import (
     parse_github_url, create_output_dir, get_repo_filename,
-    split_into_chunks, format_datetime, clean_markdown_content,
-    create_progress_spinner, print_success, print_error, print_info, print_warning
+    create_progress_spinner, render_issues_markdown, map_in_order,
+    print_success, print_error, print_info, print_warning
 )
 
 load_dotenv()
 
+# Comment fields shared by the issue query and the long-thread follow-up query
+GRAPHQL_COMMENT_FIELDS = """
+    totalCount
+    pageInfo { hasNextPage endCursor }
+    nodes { databaseId author { login } body createdAt updatedAt }
+"""
+
+GRAPHQL_ISSUES_QUERY = """
+query($owner: String!, $repo: String!, $first: Int!, $after: String, $comments: Int!,
+      $states: [IssueState!], $since: DateTime) {
+  repository(owner: $owner, name: $repo) {
+    issues(states: $states, first: $first, after: $after, filterBy: {since: $since},
+           orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title body state createdAt updatedAt url
+        author { login }
+        labels(first: 100) { nodes { name } }
+        assignees(first: 100) { nodes { login } }
+        comments(first: $comments) { %s }
+      }
+    }
+  }
+}
+""" % GRAPHQL_COMMENT_FIELDS
+
+GRAPHQL_COMMENTS_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!, $after: String) {
+  repository(owner: $owner, name: $repo) {
+    issue(number: $number) {
+      comments(first: 100, after: $after) { %s }
+    }
+  }
+}
+""" % GRAPHQL_COMMENT_FIELDS
+
+# The search API returns at most this many results for any one query
+SEARCH_RESULT_CAP = 1000
+
 
 class GitHubScraper:
     """Scrape GitHub issues and comments."""
     
-    def __init__(self, github_token: Optional[str] = None):
+    # Whether save_issues can run fetch, render and write as overlapping threaded stages
+    supports_pipeline = True
+    
+    # Whether save_repositories can fetch several repositories at once on worker threads
+    supports_concurrent_repos = True
+    
+    def __init__(self, github_token: Optional[str] = None, comment_workers: int = 8,
+                 cache_dir: Optional[str] = None, cache_max_bytes: int = 256 * 1024 * 1024,
+                 page_workers: int = 4, github_tokens: Optional[List[str]] = None,
+                 requests_per_second: float = 15.0, max_comments_per_issue: Optional[int] = None,
+                 store_path: Optional[str] = None, repo_workers: int = 1):
         self.session = requests.Session()
         self.base_url = "https://api.github.com"
+        self.comment_workers = max(1, comment_workers)
+        self.page_workers = max(1, page_workers)
+        self.max_comments_per_issue = max_comments_per_issue
+        
+        # Size the connection pool so concurrent workers (for every repository in flight) don't queue on it
+        pool_size = max(self.comment_workers, self.page_workers) * max(1, repo_workers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
         
-        # Use token from parameter or environment
-        token = github_token or os.getenv('GITHUB_TOKEN')
-        if not token:
+        # Conditional requests answered with 304 don't count against the rate limit
+        self.cache = HTTPCache(cache_dir, cache_max_bytes) if cache_dir else None
+        
+        # Fetched issues are kept locally so re-rendering and summarizing don't need the API
+        self.store = IssueStore(store_path) if store_path else None
+        
+        # Whether a listing was cut short by an error, tracked per thread since
+        # repositories can be fetched concurrently
+        self._listing = threading.local()
+        
+        # Use tokens from parameters or environment
+        tokens = list(github_tokens or [])
+        if github_token:
+            tokens.insert(0, github_token)
+        if not tokens:
+            tokens = [t.strip() for t in os.getenv('GITHUB_TOKENS', '').split(',') if t.strip()]
+        if not tokens and os.getenv('GITHUB_TOKEN'):
+            tokens = [os.getenv('GITHUB_TOKEN')]
+        if not tokens:
             raise ValueError(
                 "GitHub token is required. Please provide it via --token parameter "
-                "or set GITHUB_TOKEN environment variable."
+                "or set GITHUB_TOKEN (or GITHUB_TOKENS) environment variable."
             )
         
+        # Each request waits for the scheduler, which picks the token with the most
+        # rate limit headroom and paces requests to stay under secondary limits
+        self.scheduler = RequestScheduler(TokenPool(tokens), requests_per_second)
+        
         self.session.headers.update({
-            'Authorization': f'token {token}',
             'Accept': 'application/vnd.github.v3+json'
         })
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    def _make_request(self, url: str, params: Optional[Dict] = None) -> requests.Response:
+    def _acquire_token(self, resource: str = 'core') -> str:
+        """Wait until the scheduler allows another request and return the token to send it with."""
+        while True:
+            token, sleep_time = self.scheduler.acquire(resource)
+            if token:
+                return token
+            if sleep_time >= 10:
+                print_warning(f"Rate limit nearly exhausted. Waiting {int(sleep_time)} seconds...")
+            time.sleep(sleep_time)
+    
+    def _listing_error(self, message: str):
+        """Report a failed listing request; the issues listed before it are kept."""
+        print_error(message)
+        self._listing.interrupted = True
+    
+    def start_listing(self):
+        """Forget any earlier listing failure on this thread."""
+        self._listing.interrupted = False
+    
+    def listing_interrupted(self) -> bool:
+        """Whether an error cut short the last listing made on this thread."""
+        return getattr(self._listing, 'interrupted', False)
+    
+    def _is_rate_limited(self, response) -> bool:
+        """Check whether a response was rejected by a primary or secondary rate limit."""
+        if response.status_code not in (403, 429):
+            return False
+        
+        retry_after = response.headers.get('Retry-After')
+        
+        # Primary limit: the scheduler already saw remaining == 0 and will route or wait
+        if response.headers.get('X-RateLimit-Remaining') == '0' and not retry_after:
+            return True
+        
+        # Secondary limit: back off everything for as long as GitHub asks (a minute if unspecified)
+        if retry_after or response.status_code == 429 or 'secondary rate limit' in response.text.lower():
+            try:
+                sleep_time = float(retry_after) if retry_after else 60
+            except ValueError:
+                sleep_time = 60
+            print_warning(f"Secondary rate limit hit. Pausing requests for {int(sleep_time)} seconds...")
+            self.scheduler.pause(sleep_time)
+            return True
+        
+        return False
+    
+    def _cache_lookup(self, url: str, params: Optional[Dict]) -> Tuple[Optional[str], Optional[Dict], Dict[str, str]]:
+        """Return the cache key, any cached entry and the conditional headers to send."""
+        if not self.cache:
+            return None, None, {}
+        
+        key = self.cache.make_key(url, params)
+        entry = self.cache.get(key)
+        headers = self.cache.conditional_headers(entry) if entry else {}
+        return key, entry, headers
+    
+    def _cached_response(self, entry: Dict, response: requests.Response) -> requests.Response:
+        """Rebuild a full response from a cache entry after a 304 Not Modified."""
+        cached = requests.Response()
+        cached.status_code = 200
+        cached._content = entry['body']
+        cached.encoding = 'utf-8'
+        cached.headers = CaseInsensitiveDict(entry['headers'])
+        cached.headers.update(response.headers)
+        cached.url = response.url
+        cached.request = response.request
+        return cached
+    
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10), reraise=True)
+    def _make_request(self, url: str, params: Optional[Dict] = None,
+                      resource: str = 'core') -> requests.Response:
         """Make API request with retry logic."""
-        response = self.session.get(url, params=params)
-        
-        if response.status_code == 403:
-            # Check for rate limiting
-            if 'X-RateLimit-Remaining' in response.headers:
-                remaining = int(response.headers['X-RateLimit-Remaining'])
-                if remaining == 0:
-                    reset_time = int(response.headers['X-RateLimit-Reset'])
-                    sleep_time = reset_time - int(time.time()) + 1
-                    if sleep_time > 0:
-                        print_warning(f"Rate limit hit. Waiting {sleep_time} seconds...")
-                        time.sleep(sleep_time)
-                        return self._make_request(url, params)
+        key, entry, headers = self._cache_lookup(url, params)
+        token = self._acquire_token(resource)
+        headers['Authorization'] = f'token {token}'
+        
+        try:
+            response = self.session.get(url, params=params, headers=headers)
+        except requests.exceptions.RequestException:
+            self.scheduler.release(token, resource)
+            raise
+        self.scheduler.release(token, resource, response.headers)
+        
+        if self._is_rate_limited(response):
+            # The pool now knows this token is exhausted, so the retry goes to another one
+            return self._make_request(url, params, resource)
+        
+        if entry and response.status_code == 304:
+            return self._cached_response(entry, response)
         
         response.raise_for_status()
+        
+        if self.cache:
+            self.cache.store(key, response.headers, response.content)
+        
         return response
     
-    def fetch_issues(self, owner: str, repo: str, max_issues: Optional[int] = None) -> List[Dict]:
-        """Fetch all open issues from a repository."""
-        issues = []
-        page = 1
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10), reraise=True)
+    def _make_graphql_request(self, query: str, variables: Dict[str, Any]) -> Dict:
+        """Run a GraphQL query with retry logic and return its data."""
+        token = self._acquire_token('graphql')
+        
+        try:
+            response = self.session.post(
+                f"{self.base_url}/graphql",
+                json={'query': query, 'variables': variables},
+                headers={'Authorization': f'token {token}'}
+            )
+        except requests.exceptions.RequestException:
+            self.scheduler.release(token, 'graphql')
+            raise
+        self.scheduler.release(token, 'graphql', response.headers)
+        
+        if self._is_rate_limited(response):
+            return self._make_graphql_request(query, variables)
+        
+        response.raise_for_status()
+        payload = response.json()
+        
+        if payload.get('errors'):
+            messages = '; '.join(error.get('message', str(error)) for error in payload['errors'])
+            raise requests.exceptions.HTTPError(f"GraphQL error: {messages}", response=response)
+        
+        return payload['data']
+    
+    def _issues_params(self, page: int, per_page: int = 100,
+                       since: Optional[str] = None) -> Dict[str, Any]:
+        """Query parameters for one page of open issues (or all issues updated since a cursor)."""
+        params = {
+            'state': 'open',
+            'page': page,
+            'per_page': per_page,
+            'sort': 'created',
+            'direction': 'desc'
+        }
+        
+        # Incremental syncs also need closed issues so they can be dropped locally
+        if since:
+            params['state'] = 'all'
+            params['since'] = since
+        
+        return params
+    
+    def _has_next_page(self, response, page_size: int, per_page: int) -> bool:
+        """Check the Link header (or page size) for another page of results."""
+        if 'Link' in response.headers:
+            return 'rel="next"' in response.headers['Link']
+        return page_size >= per_page
+    
+    def _last_page(self, response) -> Optional[int]:
+        """Read the final page number from the Link header's rel="last" URL."""
+        last = response.links.get('last', {}).get('url')
+        if not last:
+            return None
+        
+        page = parse_qs(urlparse(last).query).get('page')
+        return int(page[0]) if page else None
+    
+    def _plan_issue_pages(self, next_page: int, last_page: Optional[int], fetched: int,
+                          max_issues: Optional[int], per_page: int) -> List[int]:
+        """Pick the next batch of issue pages to request concurrently."""
+        # Until a response says where pagination ends, or once issues opened mid-fetch have
+        # pushed results past the last page we knew of, walk one page at a time
+        if last_page is None or next_page > last_page:
+            return [next_page]
+        
+        end = last_page
+        if max_issues:
+            # Only request as many pages as could still be needed to reach max_issues
+            needed = -(-(max_issues - fetched) // per_page)
+            end = min(end, next_page + needed - 1)
+        
+        return list(range(next_page, end + 1))
+    
+    def _collect_issues_page(self, page_issues: List[Dict], issues: List[Dict], seen: set,
+                             exporter: Optional[JSONLExporter] = None):
+        """Add one page of issues to the result, exporting the new ones as they arrive."""
+        new_issues = []
+        
+        # Filter out pull requests (they appear as issues in the API) and issues
+        # that shifted onto a later page while pages were being fetched
+        for issue in page_issues:
+            if 'pull_request' in issue or issue['number'] in seen:
+                continue
+            seen.add(issue['number'])
+            new_issues.append(issue)
+        
+        issues.extend(new_issues)
+        if exporter:
+            exporter.write_issues(new_issues)
+    
+    def _record_issues_page(self, page: int, response, issues: List[Dict], seen: set, per_page: int,
+                            last_page: Optional[int], checkpoint: Optional[FetchCheckpoint],
+                            exporter: Optional[JSONLExporter] = None) -> Tuple[bool, Optional[int]]:
+        """Collect and checkpoint one fetched page; returns whether more pages follow and the last page."""
+        page_issues = response.json()
+        self._collect_issues_page(page_issues, issues, seen, exporter)
+        
+        has_next = bool(page_issues) and self._has_next_page(response, len(page_issues), per_page)
+        # Issues opened during the fetch move the last page, so keep the latest one seen
+        last_page = self._last_page(response) or last_page
+        
+        if checkpoint:
+            checkpoint.save_page(page, {'issues': page_issues, 'has_next': has_next, 'last_page': last_page})
+        
+        return has_next, last_page
+    
+    def _restore_issues_pages(self, checkpoint: Optional[FetchCheckpoint], issues: List[Dict],
+                              seen: set) -> Tuple[int, Optional[int], bool]:
+        """Reload checkpointed pages; returns the next page to fetch, the last page and whether more follow."""
+        records = checkpoint.load_pages() if checkpoint else []
+        
+        for record in records:
+            self._collect_issues_page(record['issues'], issues, seen)
+        
+        if not records:
+            return 1, None, True
+        
+        print_info(f"Resuming after page {len(records)} ({len(issues)} issues already fetched)")
+        return len(records) + 1, records[-1]['last_page'], records[-1]['has_next']
+    
+    def iter_issue_pages(self, owner: str, repo: str, max_issues: Optional[int] = None,
+                         since: Optional[str] = None,
+                         checkpoint: Optional[FetchCheckpoint] = None,
+                         exporter: Optional[JSONLExporter] = None) -> Iterator[List[Dict]]:
+        """Yield open issues (or every issue updated since a timestamp) a page at a time as they arrive.
+        
+        Pages restored from a checkpoint come first, as one batch. Only issue
+        numbers are kept between pages, so callers can process issues as a stream.
+        """
+        url = f"{self.base_url}/repos/{owner}/{repo}/issues"
+        seen = set()
         per_page = 100
+        restored = []
+        next_page, last_page, has_next = self._restore_issues_pages(checkpoint, restored, seen)
+        fetched = len(restored)
+        if restored:
+            yield restored
+        
+        def fetch_page(page: int) -> requests.Response:
+            return self._make_request(url, self._issues_params(page, per_page, since))
+        
+        while has_next and not (max_issues and fetched >= max_issues):
+            pages = self._plan_issue_pages(next_page, last_page, fetched, max_issues, per_page)
+            next_page = pages[-1] + 1
+            
+            try:
+                # Pages come back in request order, so issues stay sorted; only page_workers
+                # are requested ahead of the caller, so a slow consumer holds back the downloads
+                with ThreadPoolExecutor(max_workers=min(self.page_workers, len(pages))) as executor:
+                    for page, response in map_in_order(executor, fetch_page, pages, self.page_workers):
+                        page_issues = []
+                        has_next, last_page = self._record_issues_page(
+                            page, response, page_issues, seen, per_page, last_page, checkpoint, exporter
+                        )
+                        fetched += len(page_issues)
+                        yield page_issues
+            
+            except requests.exceptions.RequestException as e:
+                self._listing_error(f"Error fetching issues: {e}")
+                break
+    
+    def fetch_issues(self, owner: str, repo: str, max_issues: Optional[int] = None,
+                     since: Optional[str] = None,
+                     checkpoint: Optional[FetchCheckpoint] = None,
+                     exporter: Optional[JSONLExporter] = None) -> List[Dict]:
+        """Fetch all open issues from a repository, or every issue updated since a timestamp."""
+        issues = []
         
         with create_progress_spinner("Fetching issues...") as progress:
             task = progress.add_task("Fetching issues...", total=None)
             
-            while True:
-                url = f"{self.base_url}/repos/{owner}/{repo}/issues"
+            for page_issues in self.iter_issue_pages(owner, repo, max_issues, since, checkpoint, exporter):
+                issues.extend(page_issues)
+                progress.update(task, description=f"Fetched {len(issues)} issues...")
+        
+        return issues[:max_issues] if max_issues else issues
+    
+    @staticmethod
+    def _search_query(owner: str, repo: str, since: Optional[str], before: Optional[str]) -> str:
+        """Search qualifiers for a repository's issues, excluding pull requests server-side."""
+        qualifiers = [f"repo:{owner}/{repo}", "is:issue"]
+        # Incremental syncs also need issues that closed, so they can be dropped
+        qualifiers.append(f"updated:>={since}" if since else "is:open")
+        if before:
+            qualifiers.append(f"created:<={before}")
+        return ' '.join(qualifiers)
+    
+    def fetch_issues_search(self, owner: str, repo: str, max_issues: Optional[int] = None,
+                            since: Optional[str] = None,
+                            checkpoint: Optional[FetchCheckpoint] = None,
+                            exporter: Optional[JSONLExporter] = None) -> List[Dict]:
+        """Fetch issues through the search API so pull requests are never transferred.
+        
+        Search stops at 1,000 results per query, so once a query's results run
+        past that the next query only covers issues created at or before the
+        oldest one seen so far.
+        """
+        url = f"{self.base_url}/search/issues"
+        issues = []
+        seen = set()
+        per_page = 100
+        before, page, has_next = None, 1, True
+        
+        records = checkpoint.load_pages() if checkpoint else []
+        for record in records:
+            self._collect_issues_page(record['issues'], issues, seen)
+            before, page, has_next = record['before'], record['page'], record['has_next']
+        saved_pages = len(records)
+        if records:
+            print_info(f"Resuming after page {saved_pages} ({len(issues)} issues already fetched)")
+        
+        with create_progress_spinner("Searching issues...") as progress:
+            task = progress.add_task("Searching issues...", total=None)
+            
+            # Pages are requested one at a time: search has a much lower rate limit than core
+            while has_next and not (max_issues and len(issues) >= max_issues):
                 params = {
-                    'state': 'open',
-                    'page': page,
-                    'per_page': per_page,
+                    'q': self._search_query(owner, repo, since, before),
                     'sort': 'created',
-                    'direction': 'desc'
+                    'order': 'desc',
+                    'per_page': per_page,
+                    'page': page
                 }
                 
                 try:
-                    response = self._make_request(url, params)
-                    page_issues = response.json()
-                    
-                    if not page_issues:
-                        break
-                    
-                    # Filter out pull requests (they appear as issues in the API)
-                    page_issues = [issue for issue in page_issues if 'pull_request' not in issue]
-                    
-                    issues.extend(page_issues)
-                    progress.update(task, description=f"Fetched {len(issues)} issues...")
-                    
-                    if max_issues and len(issues) >= max_issues:
-                        issues = issues[:max_issues]
-                        break
-                    
-                    # Check if there are more pages
-                    if 'Link' in response.headers:
-                        if 'rel="next"' not in response.headers['Link']:
-                            break
-                    else:
-                        if len(page_issues) < per_page:
-                            break
-                    
+                    result = self._make_request(url, params, resource='search').json()
+                except requests.exceptions.RequestException as e:
+                    self._listing_error(f"Error searching issues: {e}")
+                    break
+                
+                page_issues = result['items']
+                total = result['total_count']
+                self._collect_issues_page(page_issues, issues, seen, exporter)
+                oldest = page_issues[-1]['created_at'] if page_issues else before
+                
+                if page_issues and page * per_page < min(total, SEARCH_RESULT_CAP):
                     page += 1
-                    
+                elif total > SEARCH_RESULT_CAP and oldest != before:
+                    # Hit the cap: start a new query from the oldest issue seen
+                    before, page = oldest, 1
+                else:
+                    has_next = False
+                
+                if checkpoint:
+                    saved_pages += 1
+                    checkpoint.save_page(saved_pages, {
+                        'issues': page_issues, 'before': before, 'page': page, 'has_next': has_next
+                    })
+                progress.update(task, description=f"Fetched {len(issues)} issues...")
+        
+        return issues[:max_issues] if max_issues else issues
+    
+    @staticmethod
+    def _graphql_author(node: Dict) -> Dict:
+        """REST-style user dict for a GraphQL author (deleted users come back as null)."""
+        return {'login': (node.get('author') or {}).get('login', 'ghost')}
+    
+    def _graphql_comment_to_rest(self, node: Dict) -> Dict:
+        """Convert a GraphQL comment node to the REST comment shape."""
+        return {
+            'id': node.get('databaseId'),
+            'user': self._graphql_author(node),
+            'body': node.get('body') or '',
+            'created_at': node['createdAt'],
+            'updated_at': node['updatedAt']
+        }
+    
+    def _graphql_issue_to_rest(self, node: Dict) -> Dict:
+        """Convert a GraphQL issue node to the REST issue shape used for rendering."""
+        return {
+            'number': node['number'],
+            'title': node['title'],
+            'body': node.get('body') or '',
+            'user': self._graphql_author(node),
+            'state': node.get('state', 'OPEN').lower(),
+            'html_url': node['url'],
+            'created_at': node['createdAt'],
+            'updated_at': node['updatedAt'],
+            'labels': [{'name': label['name']} for label in node['labels']['nodes']],
+            'assignees': [{'login': a['login']} for a in node['assignees']['nodes']],
+            'comments': node['comments']['totalCount']
+        }
+    
+    def _fetch_remaining_comments_graphql(self, owner: str, repo: str, number: int,
+                                          after: str, limit: Optional[int] = None) -> List[Dict]:
+        """Follow the comment cursor of a long thread past the embedded first page."""
+        comments = []
+        
+        while after and not (limit and len(comments) >= limit):
+            data = self._make_graphql_request(GRAPHQL_COMMENTS_QUERY, {
+                'owner': owner, 'repo': repo, 'number': number, 'after': after
+            })
+            connection = data['repository']['issue']['comments']
+            comments.extend(self._graphql_comment_to_rest(c) for c in connection['nodes'])
+            after = connection['pageInfo']['endCursor'] if connection['pageInfo']['hasNextPage'] else None
+        
+        return comments[:limit] if limit else comments
+    
+    def fetch_issues_graphql(self, owner: str, repo: str, max_issues: Optional[int] = None,
+                             fetch_comments: bool = True,
+                             comments_per_issue: int = 50,
+                             since: Optional[str] = None,
+                             checkpoint: Optional[FetchCheckpoint] = None,
+                             exporter: Optional[JSONLExporter] = None) -> Tuple[List[Dict], Dict[int, List[Dict]]]:
+        """Fetch open issues and their comments in bulk via GraphQL, in REST-compatible shapes."""
+        limit = self.max_comments_per_issue
+        if limit:
+            comments_per_issue = min(comments_per_issue, limit)
+        issues = []
+        comments_by_issue = {}
+        long_threads = {}
+        after = None
+        has_next = True
+        per_page = 50
+        
+        # Pick up where an interrupted run left off
+        records = checkpoint.load_pages() if checkpoint else []
+        for record in records:
+            issues.extend(record['issues'])
+            comments_by_issue.update({int(n): c for n, c in record['comments'].items()})
+            long_threads.update({int(n): c for n, c in record['long_threads'].items()})
+            after, has_next = record['after'], record['has_next']
+        saved_pages = len(records)
+        if records:
+            print_info(f"Resuming after page {saved_pages} ({len(issues)} issues already fetched)")
+        pages_done = len(records)
+        
+        with create_progress_spinner("Fetching issues...") as progress:
+            task = progress.add_task("Fetching issues...", total=None)
+            
+            while has_next and not (max_issues and len(issues) >= max_issues):
+                first = min(per_page, max_issues - len(issues)) if max_issues else per_page
+                variables = {
+                    'owner': owner,
+                    'repo': repo,
+                    'first': first,
+                    'after': after,
+                    'comments': comments_per_issue if fetch_comments else 0,
+                    'states': None if since else ['OPEN'],
+                    'since': since
+                }
+                
+                try:
+                    data = self._make_graphql_request(GRAPHQL_ISSUES_QUERY, variables)
                 except requests.exceptions.RequestException as e:
-                    print_error(f"Error fetching issues: {e}")
+                    self._listing_error(f"Error fetching issues: {e}")
                     break
+                
+                connection = data['repository']['issues']
+                page = {'issues': [], 'comments': {}, 'long_threads': {}}
+                
+                for node in connection['nodes']:
+                    issue = self._graphql_issue_to_rest(node)
+                    page['issues'].append(issue)
+                    
+                    if fetch_comments and issue['comments'] > 0:
+                        comments = node['comments']
+                        page['comments'][issue['number']] = [
+                            self._graphql_comment_to_rest(c) for c in comments['nodes']
+                        ]
+                        if comments['pageInfo']['hasNextPage'] and not (limit and comments_per_issue >= limit):
+                            page['long_threads'][issue['number']] = comments['pageInfo']['endCursor']
+                
+                issues.extend(page['issues'])
+                comments_by_issue.update(page['comments'])
+                long_threads.update(page['long_threads'])
+                after = connection['pageInfo']['endCursor']
+                has_next = connection['pageInfo']['hasNextPage']
+                
+                if exporter:
+                    exporter.write_issues(page['issues'])
+                    for number, comments in page['comments'].items():
+                        exporter.write_comments(number, comments)
+                
+                pages_done += 1
+                if checkpoint:
+                    checkpoint.save_page(pages_done, dict(page, after=after, has_next=has_next))
+                
+                progress.update(task, description=f"Fetched {len(issues)} issues...")
+        
+        # Long threads completed before an interruption are already whole
+        if checkpoint:
+            for number, comments in checkpoint.load_comments().items():
+                comments_by_issue[number] = comments
+                long_threads.pop(number, None)
+        
+        if long_threads:
+            with create_progress_spinner("Fetching long comment threads...") as progress:
+                task = progress.add_task("Fetching long comment threads...", total=len(long_threads))
+                
+                with ThreadPoolExecutor(max_workers=self.comment_workers) as executor:
+                    futures = {
+                        executor.submit(
+                            self._fetch_remaining_comments_graphql, owner, repo, number, cursor,
+                            limit - comments_per_issue if limit else None
+                        ): number
+                        for number, cursor in long_threads.items()
+                    }
+                    for future in as_completed(futures):
+                        number = futures[future]
+                        try:
+                            remaining = future.result()
+                            comments_by_issue[number].extend(remaining)
+                            if exporter:
+                                exporter.write_comments(number, remaining)
+                            if checkpoint:
+                                checkpoint.save_comments(number, comments_by_issue[number])
+                        except requests.exceptions.RequestException as e:
+                            print_warning(f"Error fetching comments for issue #{number}: {e}")
+                        progress.update(task, advance=1)
         
-        return issues
+        return issues[:max_issues] if max_issues else issues, comments_by_issue
+    
+    def _comment_pages(self, response, per_page: int) -> List[int]:
+        """Pages of a comment thread still to fetch after the first, capped by max_comments_per_issue."""
+        last_page = self._last_page(response) or 1
+        if self.max_comments_per_issue:
+            last_page = min(last_page, -(-self.max_comments_per_issue // per_page))
+        return list(range(2, last_page + 1))
     
     def fetch_comments(self, owner: str, repo: str, issue_number: int) -> List[Dict]:
-        """Fetch all comments for a specific issue."""
+        """Fetch all comments for a specific issue (up to max_comments_per_issue); none if the fetch fails."""
+        comments = self.try_fetch_comments(owner, repo, issue_number)
+        return comments if comments is not None else []
+    
+    def try_fetch_comments(self, owner: str, repo: str, issue_number: int) -> Optional[List[Dict]]:
+        """Fetch an issue's comments like fetch_comments, but return None if the fetch failed.
+        
+        A thread whose comments were all deleted comes back as an empty list, so
+        callers can tell it apart from a failure worth retrying.
+        """
         url = f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}/comments"
+        limit = self.max_comments_per_issue
+        per_page = min(100, limit) if limit else 100
+        
+        def fetch_page(page: int) -> requests.Response:
+            return self._make_request(url, {'per_page': per_page, 'page': page})
         
         try:
-            response = self._make_request(url)
-            return response.json()
+            response = fetch_page(1)
+            comments = response.json()
+            
+            # Long threads: fetch the remaining pages concurrently, keeping them in order
+            pages = self._comment_pages(response, per_page)
+            if pages:
+                with ThreadPoolExecutor(max_workers=min(self.page_workers, len(pages))) as executor:
+                    for page_response in executor.map(fetch_page, pages):
+                        comments.extend(page_response.json())
         except requests.exceptions.RequestException as e:
             print_warning(f"Error fetching comments for issue #{issue_number}: {e}")
+            return None
+        
+        return comments[:limit] if limit else comments
+    
+    def record_comments(self, number: int, comments: Optional[List[Dict]],
+                        checkpoint: Optional[FetchCheckpoint] = None,
+                        exporter: Optional[JSONLExporter] = None) -> List[Dict]:
+        """Export and checkpoint one issue's fetched comments, returning the thread to render.
+        
+        A failed fetch (None) renders without comments and isn't checkpointed, so a
+        resumed run retries it; an empty thread is checkpointed like any other.
+        """
+        if comments is None:
             return []
+        if exporter:
+            exporter.write_comments(number, comments)
+        if checkpoint:
+            checkpoint.save_comments(number, comments)
+        return comments
+    
+    def _restore_comments(self, checkpoint: Optional[FetchCheckpoint],
+                          numbers: List[int]) -> Dict[int, List[Dict]]:
+        """Comments already fetched for these issues by an interrupted run."""
+        if not checkpoint:
+            return {}
+        
+        saved = checkpoint.load_comments()
+        return {number: saved[number] for number in numbers if number in saved}
+    
+    def prefetch_comments(self, owner: str, repo: str, issues: List[Dict],
+                          checkpoint: Optional[FetchCheckpoint] = None,
+                          exporter: Optional[JSONLExporter] = None) -> Dict[int, List[Dict]]:
+        """Fetch comments for all commented issues using a bounded worker pool."""
+        numbers = [issue['number'] for issue in issues if issue.get('comments', 0) > 0]
+        comments_by_issue = self._restore_comments(checkpoint, numbers)
+        pending = [number for number in numbers if number not in comments_by_issue]
+        
+        if not pending:
+            return comments_by_issue
+        
+        with create_progress_spinner("Fetching comments...") as progress:
+            task = progress.add_task("Fetching comments...", total=len(numbers), completed=len(comments_by_issue))
+            
+            with ThreadPoolExecutor(max_workers=self.comment_workers) as executor:
+                futures = {
+                    executor.submit(self.try_fetch_comments, owner, repo, number): number
+                    for number in pending
+                }
+                for future in as_completed(futures):
+                    number = futures[future]
+                    comments_by_issue[number] = self.record_comments(number, future.result(), checkpoint, exporter)
+                    progress.update(
+                        task, advance=1,
+                        description=f"Fetched comments for {len(comments_by_issue)}/{len(numbers)} issues..."
+                    )
+        
+        return comments_by_issue
+    
+    def fetch_all_comments(self, owner: str, repo: str, issues: List[Dict],
+                           since: Optional[str] = None,
+                           exporter: Optional[JSONLExporter] = None) -> Dict[int, List[Dict]]:
+        """Fetch every comment in the repository through the bulk endpoint, grouped by issue.
+        
+        One paginated listing replaces a request per issue. Comments on issues
+        outside `issues` (pull requests, closed issues) are dropped.
+        """
+        url = f"{self.base_url}/repos/{owner}/{repo}/issues/comments"
+        params = {'sort': 'created', 'direction': 'asc', 'per_page': 100}
+        if since:
+            params['since'] = since
+        
+        numbers = {issue['number'] for issue in issues}
+        limit = self.max_comments_per_issue
+        comments_by_issue = {}
+        
+        def fetch_page(page: int) -> requests.Response:
+            return self._make_request(url, {**params, 'page': page})
+        
+        def collect(response: requests.Response):
+            page_comments = {}
+            for comment in response.json():
+                number = int(comment['issue_url'].rsplit('/', 1)[-1])
+                thread = comments_by_issue.setdefault(number, []) if number in numbers else None
+                if thread is not None and not (limit and len(thread) >= limit):
+                    thread.append(comment)
+                    page_comments.setdefault(number, []).append(comment)
+            
+            if exporter:
+                for number, comments in page_comments.items():
+                    exporter.write_comments(number, comments)
+        
+        with create_progress_spinner("Fetching comments...") as progress:
+            task = progress.add_task("Fetching comments...", total=None)
+            
+            try:
+                response = fetch_page(1)
+                collect(response)
+                
+                pages = list(range(2, (self._last_page(response) or 1) + 1))
+                if pages:
+                    progress.update(task, total=len(pages) + 1, completed=1)
+                    with ThreadPoolExecutor(max_workers=min(self.page_workers, len(pages))) as executor:
+                        for page_response in executor.map(fetch_page, pages):
+                            collect(page_response)
+                            progress.update(
+                                task, advance=1,
+                                description=f"Fetched comments for {len(comments_by_issue)} issues..."
+                            )
+            except requests.exceptions.RequestException as e:
+                print_warning(f"Error fetching repository comments: {e}")
+        
+        return comments_by_issue
+    
+    def _merge_comments(self, stored: List[Dict], updated: List[Dict]) -> List[Dict]:
+        """Overlay comments created or edited since the last sync on a stored thread.
+        
+        Comments are matched by id, or by creation time and author for ones stored
+        without an id (from GraphQL fetches made before ids were requested). The
+        merged thread is capped at max_comments_per_issue like a fresh fetch.
+        """
+        def author_key(comment: Dict) -> Tuple[str, Optional[str]]:
+            return comment['created_at'], (comment.get('user') or {}).get('login')
+        
+        ids = {comment.get('id') for comment in updated} - {None}
+        keys = {author_key(comment) for comment in updated}
+        kept = [
+            comment for comment in stored
+            if (comment['id'] not in ids if comment.get('id') else author_key(comment) not in keys)
+        ]
+        
+        merged = sorted(kept + updated, key=lambda comment: (comment['created_at'], comment.get('id') or 0))
+        limit = self.max_comments_per_issue
+        return merged[:limit] if limit else merged
     
     def issues_to_markdown(self, issues: List[Dict], owner: str, repo: str, 
-                          fetch_comments: bool = True) -> str:
+                          fetch_comments: bool = True,
+                          comments_by_issue: Optional[Dict[int, List[Dict]]] = None) -> str:
         """Convert issues to markdown format."""
-        markdown_parts = [f"# GitHub Issues for {owner}/{repo}\n\n"]
-        markdown_parts.append(f"*Generated on {format_datetime(time.strftime('%Y-%m-%dT%H:%M:%SZ'))}*\n\n")
-        markdown_parts.append(f"**Total Open Issues:** {len(issues)}\n\n")
-        markdown_parts.append("---\n\n")
+        if fetch_comments and comments_by_issue is None:
+            comments_by_issue = self.prefetch_comments(owner, repo, issues)
+        
+        return render_issues_markdown(
+            issues, owner, repo,
+            comments_by_issue=comments_by_issue if fetch_comments else None,
+            show_omitted=bool(self.max_comments_per_issue)
+        )
+    
+    def _sync_state_path(self, output_dir: str, owner: str, repo: str) -> Path:
+        """Location of the incremental sync state for a repository."""
+        return Path(output_dir) / f"{get_repo_filename(owner, repo, 'sync_state')}.json"
+    
+    def load_sync_state(self, output_dir: str, owner: str, repo: str) -> Optional[Dict]:
+        """Load the stored issue set and sync cursor from a previous run, if any."""
+        path = self._sync_state_path(output_dir, owner, repo)
+        if not path.exists():
+            return None
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        
+        # JSON object keys are strings; comments are keyed by issue number
+        state['comments'] = {int(number): comments for number, comments in state['comments'].items()}
+        return state
+    
+    def save_sync_state(self, output_dir: str, owner: str, repo: str, since: Optional[str],
+                        issues: List[Dict], comments_by_issue: Dict[int, List[Dict]]):
+        """Persist the issue set and sync cursor, replacing the previous state atomically."""
+        path = self._sync_state_path(output_dir, owner, repo)
+        tmp_path = path.with_suffix('.json.tmp')
         
-        with create_progress_spinner("Processing issues...") as progress:
-            task = progress.add_task("Processing issues...", total=len(issues))
+        state = {
+            'owner': owner,
+            'repo': repo,
+            'since': since,
+            'issues': issues,
+            'comments': comments_by_issue
+        }
+        
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+    
+    def _merge_synced_issues(self, state: Dict, updated: List[Dict],
+                             updated_comments: Dict[int, List[Dict]]) -> Tuple[List[Dict], Dict[int, List[Dict]]]:
+        """Merge issues updated since the last sync into the stored set, dropping closed ones."""
+        issues = {issue['number']: issue for issue in state['issues']}
+        comments_by_issue = dict(state['comments'])
+        
+        for issue in updated:
+            number = issue['number']
+            comments_by_issue.pop(number, None)
             
-            for issue in issues:
-                # Issue header
-                markdown_parts.append(f"## Issue #{issue['number']}: {issue['title']}\n\n")
-                
-                # Metadata
-                markdown_parts.append(f"**Author:** {issue['user']['login']}\n")
-                markdown_parts.append(f"**Created:** {format_datetime(issue['created_at'])}\n")
-                
-                if issue.get('updated_at'):
-                    markdown_parts.append(f"**Updated:** {format_datetime(issue['updated_at'])}\n")
-                
-                if issue.get('labels'):
-                    labels = ', '.join([label['name'] for label in issue['labels']])
-                    markdown_parts.append(f"**Labels:** {labels}\n")
-                
-                if issue.get('assignees'):
-                    assignees = ', '.join([a['login'] for a in issue['assignees']])
-                    markdown_parts.append(f"**Assignees:** {assignees}\n")
-                
-                markdown_parts.append("\n")
-                
-                # Issue description
-                markdown_parts.append("### Description\n\n")
-                description = clean_markdown_content(issue.get('body', 'No description provided.'))
-                markdown_parts.append(f"{description}\n\n")
-                
-                # Fetch and add comments
-                if fetch_comments and issue.get('comments', 0) > 0:
-                    comments = self.fetch_comments(owner, repo, issue['number'])
-                    if comments:
-                        markdown_parts.append("### Comments\n\n")
-                        for comment in comments:
-                            author = comment['user']['login']
-                            created = format_datetime(comment['created_at'])
-                            body = clean_markdown_content(comment.get('body', ''))
-                            
-                            markdown_parts.append(f"#### Comment by {author} ({created})\n\n")
-                            markdown_parts.append(f"{body}\n\n")
-                
-                markdown_parts.append("---\n\n")
-                progress.update(task, advance=1)
+            if issue.get('state', 'open') != 'open':
+                issues.pop(number, None)
+                continue
+            
+            issues[number] = issue
+            if number in updated_comments:
+                comments_by_issue[number] = updated_comments[number]
+        
+        merged = sorted(issues.values(), key=lambda issue: (issue['created_at'], issue['number']), reverse=True)
+        return merged, comments_by_issue
+    
+    def close_unlisted(self, owner: str, repo: str, open_issues: List[Dict], capped: bool = False):
+        """Mark stored issues missing from a listing of open issues (newest first) as closed.
+        
+        A listing cut short by max_issues only speaks for issues newer than the
+        oldest one it contains.
+        """
+        if capped and not open_issues:
+            return
+        created_after = min(issue['created_at'] for issue in open_issues) if capped else None
+        self.store.close_missing(owner, repo, [issue['number'] for issue in open_issues], created_after)
+    
+    def _sync_store(self, owner: str, repo: str, issues: List[Dict], open_issues: List[Dict],
+                    comments_by_issue: Optional[Dict[int, List[Dict]]], incremental: bool,
+                    fetched_since: Optional[str], since: Optional[str],
+                    capped: bool = False) -> Tuple[List[Dict], Dict[int, List[Dict]]]:
+        """Upsert a fetch into the issue store and read back the issues to render."""
+        self.store.upsert_issues(owner, repo, issues, comments_by_issue)
+        
+        # A full listing of open issues (not just recent updates) shows which stored ones have closed since
+        if not fetched_since and not self.listing_interrupted():
+            self.close_unlisted(owner, repo, open_issues, capped)
         
-        return ''.join(markdown_parts)
+        if incremental:
+            self.store.set_sync_cursor(owner, repo, since)
+            issues = self.store.load_issues(owner, repo)
+        else:
+            # Keep the order the API listed them in
+            position = {issue['number']: i for i, issue in enumerate(open_issues)}
+            issues = sorted(self.store.load_issues(owner, repo, list(position)),
+                            key=lambda issue: position[issue['number']])
+        
+        numbers = [issue['number'] for issue in issues]
+        return issues, self.store.load_comments(owner, repo, numbers) if comments_by_issue is not None else {}
     
     def save_issues(self, url: str, output_dir: str = "issues", 
                    max_issues: Optional[int] = None,
-                   max_issues_per_file: int = 50) -> List[str]:
+                   max_issues_per_file: int = 50,
+                   fetch_comments: bool = True,
+                   api: str = 'rest',
+                   incremental: bool = False,
+                   resume: bool = False,
+                   bulk_comments: bool = False,
+                   export_jsonl: bool = False,
+                   export_parquet: bool = False,
+                   pipeline: bool = False) -> List[str]:
         """Fetch and save issues to markdown files."""
         owner, repo = parse_github_url(url)
+        comments_by_issue = None
+        
+        # Created up front so a missing pyarrow fails before anything is fetched
+        parquet = ParquetExporter(output_dir, owner, repo) if export_parquet else None
+        state = None
+        since = None
+        
+        if incremental:
+            if max_issues:
+                print_warning("--max-issues is ignored for incremental syncs")
+                max_issues = None
+            
+            if self.store:
+                since = self.store.get_sync_cursor(owner, repo)
+            else:
+                state = self.load_sync_state(output_dir, owner, repo)
+                since = state['since'] if state else None
+        
+        # Pages and comments are checkpointed as they arrive so a crashed run can be resumed
+        checkpoint = FetchCheckpoint(
+            Path(output_dir) / '.checkpoints' / get_repo_filename(owner, repo),
+            {'api': api, 'since': since, 'max_issues': max_issues, 'fetch_comments': fetch_comments}
+        )
+        resumed = checkpoint.start(resume)
+        if resume and not resumed:
+            print_warning("No matching checkpoint found, starting from the beginning")
+        
+        # Raw JSON is appended as pages arrive; a resumed run adds to what was already written
+        exporter = JSONLExporter(output_dir, owner, repo) if export_jsonl else None
+        if exporter:
+            exporter.start(resumed)
+        
+        self.start_listing()
+        
+        if since:
+            print_info(f"Fetching issues from {owner}/{repo} updated since {since}...")
+        else:
+            print_info(f"Fetching issues from {owner}/{repo}...")
+        
+        if pipeline and (api != 'rest' or incremental or bulk_comments or parquet or not self.supports_pipeline):
+            print_warning("The staged pipeline only covers plain REST fetches; running stages one at a time")
+            pipeline = False
+        
+        if pipeline:
+            saved_files = IssuePipeline(
+                self, owner, repo, output_dir, max_issues, max_issues_per_file,
+                fetch_comments=fetch_comments, checkpoint=checkpoint, exporter=exporter
+            ).run()
+            if exporter:
+                exporter.close()
+            checkpoint.clear()
+            if not saved_files:
+                print_warning("No open issues found.")
+            return saved_files
+        
+        if api == 'graphql':
+            issues, comments_by_issue = self.fetch_issues_graphql(
+                owner, repo, max_issues, fetch_comments=fetch_comments, since=since,
+                checkpoint=checkpoint, exporter=exporter
+            )
+        elif api == 'search':
+            issues = self.fetch_issues_search(owner, repo, max_issues, since=since,
+                                              checkpoint=checkpoint, exporter=exporter)
+        else:
+            issues = self.fetch_issues(owner, repo, max_issues, since=since,
+                                       checkpoint=checkpoint, exporter=exporter)
         
-        print_info(f"Fetching issues from {owner}/{repo}...")
-        issues = self.fetch_issues(owner, repo, max_issues)
+        fetched_since = since
+        if incremental:
+            # Advance the cursor to the newest update seen, including issues that just closed
+            since = max([issue['updated_at'] for issue in issues] + ([since] if since else []), default=None)
+            if fetched_since:
+                print_success(f"Found {len(issues)} issues updated since the last sync")
+        
+        # Fetch every issue's comments up front so rendering never waits on the network
+        open_issues = [issue for issue in issues if issue.get('state', 'open') == 'open']
+        if comments_by_issue is None and fetch_comments and bulk_comments:
+            comments_by_issue = self.fetch_all_comments(owner, repo, open_issues, since=fetched_since,
+                                                        exporter=exporter)
+            if fetched_since:
+                # Only comments changed since the last sync came back; keep the rest of each thread
+                numbers = [issue['number'] for issue in open_issues]
+                stored = self.store.load_comments(owner, repo, numbers) if self.store else state['comments']
+                comments_by_issue = {
+                    number: self._merge_comments(stored.get(number, []), comments_by_issue.get(number, []))
+                    for number in numbers
+                }
+        if comments_by_issue is None:
+            comments_by_issue = self.prefetch_comments(
+                owner, repo, open_issues, checkpoint, exporter
+            ) if fetch_comments else {}
+        
+        if exporter:
+            exporter.close()
+            print_success(f"Exported raw issues and comments to {exporter.issues_path} and {exporter.comments_path}")
+        
+        if self.store:
+            issues, comments_by_issue = self._sync_store(
+                owner, repo, issues, open_issues, comments_by_issue if fetch_comments else None,
+                incremental, fetched_since, since, capped=bool(max_issues)
+            )
+        elif state:
+            issues, comments_by_issue = self._merge_synced_issues(state, issues, comments_by_issue)
+        else:
+            issues = open_issues
+        
+        if incremental and not self.store:
+            create_output_dir(output_dir)
+            self.save_sync_state(output_dir, owner, repo, since, issues, comments_by_issue)
         
         if not issues:
+            checkpoint.clear()
             print_warning("No open issues found.")
             return []
         
         print_success(f"Found {len(issues)} open issues")
         
-        # Create output directory
-        output_path = create_output_dir(output_dir)
-        
-        # Split issues into chunks if necessary
-        chunks = split_into_chunks(issues, max_issues_per_file)
-        saved_files = []
+        if parquet:
+            parquet_files = parquet.write(issues, comments_by_issue if fetch_comments else None)
+            print_success(f"Exported issues to {', '.join(parquet_files)}")
         
-        for i, chunk in enumerate(chunks, 1):
-            # Generate markdown
-            markdown_content = self.issues_to_markdown(chunk, owner, repo)
+        # Each issue is rendered and written as it's reached, rotating files at max_issues_per_file
+        writer = MarkdownWriter(
+            output_dir, owner, repo, len(issues), max_issues_per_file,
+            show_omitted=bool(self.max_comments_per_issue)
+        )
+        with create_progress_spinner("Writing issues...") as progress, writer:
+            task = progress.add_task("Writing issues...", total=len(issues))
             
-            # Save to file
-            if len(chunks) > 1:
-                filename = f"{get_repo_filename(owner, repo, f'issues_{i}')}.md"
-            else:
-                filename = f"{get_repo_filename(owner, repo, 'issues')}.md"
+            for issue in issues:
+                writer.write_issue(issue, comments_by_issue.get(issue['number'], []) if fetch_comments else None)
+                progress.update(task, advance=1)
+        
+        saved_files = writer.saved_files
+        
+        checkpoint.clear()
+        return saved_files
+    
+    def list_org_repositories(self, org: str, include_inactive: bool = False) -> List[str]:
+        """List the repositories in an organization as owner/repo.
+        
+        Archived repositories, empty ones and ones with issues disabled are
+        skipped unless include_inactive is set.
+        """
+        repos = []
+        skipped = 0
+        page = 1
+        
+        while True:
+            response = self._make_request(
+                f"{self.base_url}/orgs/{org}/repos",
+                params={'type': 'all', 'sort': 'full_name', 'page': page, 'per_page': 100}
+            )
+            page_repos = response.json()
+            for repo in page_repos:
+                if include_inactive or not (repo.get('archived') or repo.get('size') == 0
+                                            or repo.get('has_issues') is False):
+                    repos.append(repo['full_name'])
+                else:
+                    skipped += 1
             
-            filepath = output_path / filename
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            if not self._has_next_page(response, len(page_repos), 100):
+                break
+            page += 1
+        
+        if skipped:
+            print_info(f"Skipped {skipped} archived, empty or issue-less repositories in {org}")
+        return repos
+    
+    def save_repositories(self, urls: List[str], output_dir: str = "issues", repo_workers: int = 4,
+                          **options) -> Dict[str, List[str]]:
+        """Save issues for several repositories, repo_workers at a time, through this scraper.
+        
+        Every repository shares the scraper's connection pool, token pool and request
+        scheduler. One that fails is reported and skipped. Returns the files saved for
+        each repository that succeeded, in input order.
+        """
+        if repo_workers > 1 and not self.supports_concurrent_repos:
+            print_warning("This engine fetches one repository at a time")
+            repo_workers = 1
+        
+        saved = {}
+        failed = []
+        
+        with create_progress_spinner("Fetching repositories...") as progress, \
+                ThreadPoolExecutor(max_workers=max(1, repo_workers)) as executor:
+            task = progress.add_task(f"Fetched 0/{len(urls)} repositories...", total=len(urls))
+            futures = {executor.submit(self.save_issues, url, output_dir, **options): url for url in urls}
             
-            saved_files.append(str(filepath))
-            print_success(f"Saved {len(chunk)} issues to {filepath}")
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    saved[url] = future.result()
+                except Exception as e:
+                    print_error(f"Failed to fetch issues for {url}: {e}")
+                    failed.append(url)
+                
+                done = len(saved) + len(failed)
+                progress.update(task, advance=1, description=f"Fetched {done}/{len(urls)} repositories...")
+        
+        if failed:
+            print_warning(f"{len(failed)} of {len(urls)} repositories failed: {', '.join(failed)}")
         
-        return saved_files
\ No newline at end of file
+        return {url: saved[url] for url in urls if url in saved}
+    
+    def close(self):
+        """Release pooled HTTP connections and the response cache."""
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+        if self.store:
+            self.store.close()
\ No newline at end of file
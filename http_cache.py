@@ -0,0 +1,55 @@
+import json
+from pathlib import Path
+from typing import Dict, Optional, Mapping
+from urllib.parse import urlencode
+
+from sqlite_lru import SQLiteLRUStore
+
+# Response headers worth keeping: validators plus what callers read from a cached body
+CACHED_HEADERS = ('ETag', 'Last-Modified', 'Link', 'Content-Type')
+
+
+class HTTPCache:
+    """On-disk cache of GET responses revalidated with ETag / Last-Modified."""
+    
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024):
+        self._responses = SQLiteLRUStore(
+            Path(cache_dir) / 'http_cache.sqlite', 'responses',
+            {'headers': 'TEXT NOT NULL', 'body': 'BLOB NOT NULL'}, max_bytes
+        )
+    
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        """Cache key for a URL and its query parameters."""
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached entry for a key and mark it as recently used."""
+        row = self._responses.get(key)
+        if row is None:
+            return None
+        return {'headers': json.loads(row[0]), 'body': row[1]}
+    
+    @staticmethod
+    def conditional_headers(entry: Dict) -> Dict[str, str]:
+        """Request headers that revalidate a cached entry."""
+        headers = {}
+        if entry['headers'].get('ETag'):
+            headers['If-None-Match'] = entry['headers']['ETag']
+        if entry['headers'].get('Last-Modified'):
+            headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+        return headers
+    
+    def store(self, key: str, headers: Mapping[str, str], body: bytes):
+        """Cache a response body if it carries a validator, evicting old entries as needed."""
+        kept = {name: headers[name] for name in CACHED_HEADERS if name in headers}
+        if 'ETag' not in kept and 'Last-Modified' not in kept:
+            return
+        
+        self._responses.put(key, (json.dumps(kept), body), len(body))
+    
+    def close(self):
+        """Close the underlying database."""
+        self._responses.close()
\ No newline at end of file
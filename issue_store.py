@@ -0,0 +1,226 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS issues (
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    body TEXT,
+    state TEXT NOT NULL,
+    author TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT,
+    html_url TEXT,
+    comment_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (owner, repo, number)
+);
+CREATE INDEX IF NOT EXISTS issues_by_state ON issues (owner, repo, state, created_at);
+
+CREATE TABLE IF NOT EXISTS comments (
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    issue_number INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    id INTEGER,
+    author TEXT,
+    body TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT,
+    PRIMARY KEY (owner, repo, issue_number, position)
+);
+
+CREATE TABLE IF NOT EXISTS labels (
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    issue_number INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (owner, repo, issue_number, name)
+);
+CREATE INDEX IF NOT EXISTS labels_by_name ON labels (owner, repo, name);
+
+CREATE TABLE IF NOT EXISTS assignees (
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    issue_number INTEGER NOT NULL,
+    login TEXT NOT NULL,
+    PRIMARY KEY (owner, repo, issue_number, login)
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    since TEXT,
+    PRIMARY KEY (owner, repo)
+);
+'''
+
+# SQLite caps the number of bound parameters per statement
+QUERY_BATCH = 500
+
+
+class IssueStore:
+    """Local SQLite copy of fetched issues and comments, keyed by repository and issue number."""
+    
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+    
+    def upsert_issues(self, owner: str, repo: str, issues: List[Dict],
+                      comments_by_issue: Optional[Dict[int, List[Dict]]] = None):
+        """Insert or replace issues, and the comment threads fetched for them, in one transaction."""
+        numbers = [(owner, repo, issue['number']) for issue in issues]
+        
+        with self._lock, self._conn:
+            self._conn.executemany('''
+                INSERT OR REPLACE INTO issues
+                    (owner, repo, number, title, body, state, author, created_at, updated_at, html_url, comment_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (owner, repo, issue['number'], issue['title'], issue.get('body'),
+                 issue.get('state', 'open'), issue['user']['login'], issue['created_at'],
+                 issue.get('updated_at'), issue.get('html_url'), issue.get('comments', 0))
+                for issue in issues
+            ])
+            
+            # Labels and assignees are replaced wholesale: either can be removed upstream
+            self._conn.executemany('DELETE FROM labels WHERE owner = ? AND repo = ? AND issue_number = ?', numbers)
+            self._conn.executemany('DELETE FROM assignees WHERE owner = ? AND repo = ? AND issue_number = ?', numbers)
+            self._conn.executemany('INSERT OR IGNORE INTO labels VALUES (?, ?, ?, ?)', [
+                (owner, repo, issue['number'], label['name'])
+                for issue in issues for label in issue.get('labels') or []
+            ])
+            self._conn.executemany('INSERT OR IGNORE INTO assignees VALUES (?, ?, ?, ?)', [
+                (owner, repo, issue['number'], assignee['login'])
+                for issue in issues for assignee in issue.get('assignees') or []
+            ])
+            
+            # Threads are replaced wholesale too; a fetch without comments (--no-comments)
+            # leaves nothing to keep them current with, so they're dropped rather than left stale
+            self._conn.executemany('DELETE FROM comments WHERE owner = ? AND repo = ? AND issue_number = ?', numbers)
+            if comments_by_issue is not None:
+                self._conn.executemany('INSERT INTO comments VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', [
+                    (owner, repo, number, position, comment.get('id'), comment['user']['login'],
+                     comment.get('body'), comment['created_at'], comment.get('updated_at'))
+                    for number, comments in comments_by_issue.items()
+                    for position, comment in enumerate(comments)
+                ])
+    
+    def close_missing(self, owner: str, repo: str, open_numbers: Iterable[int],
+                      created_after: Optional[str] = None):
+        """Mark stored open issues that a listing of open issues no longer contains as closed.
+        
+        A newest-first listing cut short by --max-issues only covers issues created
+        after created_after, so older stored issues are left as they are.
+        """
+        with self._lock, self._conn:
+            self._conn.execute('CREATE TEMP TABLE IF NOT EXISTS listed (number INTEGER PRIMARY KEY)')
+            self._conn.execute('DELETE FROM listed')
+            self._conn.executemany('INSERT OR IGNORE INTO listed VALUES (?)', [(n,) for n in open_numbers])
+            self._conn.execute('''
+                UPDATE issues SET state = 'closed'
+                WHERE owner = ? AND repo = ? AND state = 'open' AND number NOT IN (SELECT number FROM listed)
+                    AND (? IS NULL OR created_at > ?)
+            ''', (owner, repo, created_after, created_after))
+    
+    def _related(self, table: str, column: str, owner: str, repo: str,
+                 numbers: List[int]) -> Dict[int, List[str]]:
+        """Values of a per-issue table (labels, assignees) grouped by issue number."""
+        grouped = {}
+        for i in range(0, len(numbers), QUERY_BATCH):
+            batch = numbers[i:i + QUERY_BATCH]
+            rows = self._conn.execute(
+                f'SELECT issue_number, {column} FROM {table} '
+                f'WHERE owner = ? AND repo = ? AND issue_number IN ({",".join("?" * len(batch))}) '
+                f'ORDER BY issue_number, rowid',
+                [owner, repo, *batch]
+            )
+            for number, value in rows:
+                grouped.setdefault(number, []).append(value)
+        return grouped
+    
+    def load_issues(self, owner: str, repo: str, numbers: Optional[List[int]] = None) -> List[Dict]:
+        """Open issues for a repository (or just the given numbers), newest first, in REST shape."""
+        query = '''
+            SELECT number, title, body, state, author, created_at, updated_at, html_url, comment_count
+            FROM issues WHERE owner = ? AND repo = ? AND state = 'open'
+            ORDER BY created_at DESC, number DESC
+        '''
+        wanted = set(numbers) if numbers is not None else None
+        
+        with self._lock:
+            rows = [row for row in self._conn.execute(query, (owner, repo))
+                    if wanted is None or row[0] in wanted]
+            found = [row[0] for row in rows]
+            labels = self._related('labels', 'name', owner, repo, found)
+            assignees = self._related('assignees', 'login', owner, repo, found)
+        
+        return [{
+            'number': number,
+            'title': title,
+            'body': body,
+            'state': state,
+            'user': {'login': author},
+            'created_at': created_at,
+            'updated_at': updated_at,
+            'html_url': html_url,
+            'comments': comment_count,
+            'labels': [{'name': name} for name in labels.get(number, [])],
+            'assignees': [{'login': login} for login in assignees.get(number, [])]
+        } for number, title, body, state, author, created_at, updated_at, html_url, comment_count in rows]
+    
+    def load_comments(self, owner: str, repo: str, numbers: List[int]) -> Dict[int, List[Dict]]:
+        """Stored comment threads for the given issues, in thread order."""
+        comments_by_issue = {}
+        
+        with self._lock:
+            for i in range(0, len(numbers), QUERY_BATCH):
+                batch = numbers[i:i + QUERY_BATCH]
+                rows = self._conn.execute(
+                    'SELECT issue_number, id, author, body, created_at, updated_at FROM comments '
+                    f'WHERE owner = ? AND repo = ? AND issue_number IN ({",".join("?" * len(batch))}) '
+                    'ORDER BY issue_number, position',
+                    [owner, repo, *batch]
+                )
+                for number, comment_id, author, body, created_at, updated_at in rows:
+                    comment = {'user': {'login': author}, 'body': body,
+                               'created_at': created_at, 'updated_at': updated_at}
+                    if comment_id is not None:
+                        comment['id'] = comment_id
+                    comments_by_issue.setdefault(number, []).append(comment)
+        
+        return comments_by_issue
+    
+    def has_repo(self, owner: str, repo: str) -> bool:
+        """Whether any issues have been stored for a repository."""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT 1 FROM issues WHERE owner = ? AND repo = ? LIMIT 1', (owner, repo)
+            ).fetchone() is not None
+    
+    def get_sync_cursor(self, owner: str, repo: str) -> Optional[str]:
+        """The updated-since timestamp the next incremental sync should start from."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT since FROM sync_state WHERE owner = ? AND repo = ?', (owner, repo)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def set_sync_cursor(self, owner: str, repo: str, since: Optional[str]):
+        """Record where the next incremental sync should start."""
+        with self._lock, self._conn:
+            self._conn.execute('INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)', (owner, repo, since))
+    
+    def close(self):
+        """Close the underlying database."""
+        with self._lock:
+            self._conn.close()
\ No newline at end of file
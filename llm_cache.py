@@ -0,0 +1,34 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional
+
+from sqlite_lru import SQLiteLRUStore
+
+
+class LLMCache:
+    """On-disk cache of LLM responses keyed by a hash of everything that shapes them."""
+    
+    def __init__(self, cache_dir: str, max_bytes: int = 64 * 1024 * 1024):
+        self._completions = SQLiteLRUStore(
+            Path(cache_dir) / 'llm_cache.sqlite', 'completions', {'response': 'TEXT NOT NULL'}, max_bytes
+        )
+    
+    @staticmethod
+    def make_key(provider: str, model: str, system_prompt: str, user_prompt: str) -> str:
+        """Cache key for one request: a SHA-256 of the provider, model and both prompts."""
+        payload = json.dumps([provider, model, system_prompt, user_prompt])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key and mark it as recently used."""
+        row = self._completions.get(key)
+        return row[0] if row else None
+    
+    def store(self, key: str, response: str):
+        """Cache a response, evicting the least recently used ones as needed."""
+        self._completions.put(key, (response,), len(response.encode('utf-8')))
+    
+    def close(self):
+        """Close the underlying database."""
+        self._completions.close()
\ No newline at end of file
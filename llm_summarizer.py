@@ -1,27 +1,76 @@
+import heapq
+import math
 import os
-from typing import List, Optional, Dict, Any
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Dict, Any
 from pathlib import Path
 from dotenv import load_dotenv
 import json
 
+from issue_store import IssueStore
+from llm_cache import LLMCache
+from rate_limit import TokenBucket
+from tokenizer import TokenCounter
 from utils import (
     load_issue_files, create_output_dir, get_repo_filename,
-    estimate_tokens, create_progress_spinner,
+    create_progress_spinner, render_issues_markdown,
     print_success, print_error, print_info, print_warning
 )
 
 load_dotenv()
 
+# Requests per minute allowed by each provider's entry-level tier, assumed unless configured
+DEFAULT_REQUESTS_PER_MINUTE = {'openai': 500, 'anthropic': 50}
+
+# Longest reply requested from the model
+MAX_OUTPUT_TOKENS = 4000
+
+# Requests per submitted batch, kept well inside both providers' request and size limits
+BATCH_MAX_REQUESTS = 10000
+BATCH_MAX_BYTES = 100 * 1024 * 1024
+
+# Batch states after which no more results will arrive; all but 'completed' may be partial
+OPENAI_BATCH_ENDED = ('completed', 'failed', 'expired', 'cancelled')
+
 
 class LLMSummarizer:
     """Summarize GitHub issues using LLMs."""
     
-    def __init__(self, provider: Optional[str] = None, model: Optional[str] = None):
+    def __init__(self, provider: Optional[str] = None, model: Optional[str] = None,
+                 cache_dir: Optional[str] = None, cache_max_bytes: int = 64 * 1024 * 1024,
+                 max_concurrency: int = 4, requests_per_minute: Optional[float] = None,
+                 reduce_fan_in: int = 10, chunk_fill: float = 0.75, base_url: Optional[str] = None,
+                 batch: bool = False, batch_poll_interval: float = 30.0):
         self.provider = provider or os.getenv('LLM_PROVIDER', 'openai')
         self.model = model
+        self.base_url = base_url
         self.client = None
         
         self._initialize_client()
+        
+        # Every request, from any chunk or repository, shares one concurrency cap and rate limit
+        self.max_concurrency = max(1, max_concurrency)
+        self._slots = threading.Semaphore(self.max_concurrency)
+        rate = (requests_per_minute or DEFAULT_REQUESTS_PER_MINUTE.get(self.provider, 50)) / 60
+        self._bucket = TokenBucket(rate, capacity=self.max_concurrency)
+        self._bucket_lock = threading.Lock()
+        
+        # Partial summaries merged per request when consolidating
+        self.reduce_fan_in = max(2, reduce_fan_in)
+        
+        # Chunks are packed to chunk_fill of the model's context window, counted with its tokenizer
+        self.token_counter = TokenCounter(self.provider, self.model)
+        self.chunk_fill = chunk_fill
+        
+        # Identical prompts (unchanged issues since the last run) are answered from disk
+        self.cache = LLMCache(cache_dir, cache_max_bytes) if cache_dir else None
+        
+        # Send prompts through the provider's discounted, asynchronous batch API instead
+        self.batch = batch
+        self.batch_poll_interval = batch_poll_interval
     
     def _initialize_client(self):
         """Initialize the LLM client based on provider."""
@@ -32,10 +81,10 @@ class LLMSummarizer:
                 if not api_key:
                     raise ValueError("OPENAI_API_KEY not found in environment")
                 
-                self.client = openai.OpenAI(api_key=api_key)
+                self.client = openai.OpenAI(api_key=api_key, base_url=self.base_url)
                 self.model = self.model or os.getenv('LLM_MODEL', 'gpt-4o-mini')
                 print_info(f"Using OpenAI with model: {self.model}")
-                
+            
             except ImportError:
                 raise ImportError("OpenAI library not installed. Run: pip install openai")
         
@@ -46,10 +95,10 @@ class LLMSummarizer:
                 if not api_key:
                     raise ValueError("ANTHROPIC_API_KEY not found in environment")
                 
-                self.client = anthropic.Anthropic(api_key=api_key)
+                self.client = anthropic.Anthropic(api_key=api_key, base_url=self.base_url)
                 self.model = self.model or os.getenv('LLM_MODEL', 'claude-3-haiku-20240307')
                 print_info(f"Using Anthropic with model: {self.model}")
-                
+            
             except ImportError:
                 raise ImportError("Anthropic library not installed. Run: pip install anthropic")
         
@@ -59,7 +108,7 @@ class LLMSummarizer:
     def _create_system_prompt(self) -> str:
         """Create the system prompt for issue summarization."""
         return """You are an expert at analyzing GitHub issues and providing actionable summaries.
-        
+
 Your task is to analyze the provided GitHub issues and create a comprehensive summary that includes:
 
 1. **Overview**: Brief summary of the repository's issue landscape
@@ -84,39 +133,127 @@ Be concise but comprehensive. Focus on actionable insights."""
         prompt += "Provide a comprehensive summary following the guidelines in your instructions."
         return prompt
     
-    def _chunk_content(self, content: str, max_tokens: int = 100000) -> List[str]:
-        """Split content into chunks that fit within token limits."""
-        # Estimate tokens and split if needed
-        estimated_tokens = estimate_tokens(content)
+    def _create_rollup_prompt(self, summaries: str, org: str) -> str:
+        """Create the prompt that combines per-repository summaries into an organization rollup."""
+        return f"""Please create an organization-wide summary of GitHub issues for the {org} organization from these per-repository summaries.
+
+Follow the same structure as before, but across repositories: call out the repositories that need the most attention,
+themes and problems shared by several repositories, and recommendations for the organization as a whole.
+
+Repository Summaries:
+{summaries}"""
+    
+    def _chunk_budget(self) -> int:
+        """Tokens of issue content per request: chunk_fill of the model's window, less the prompts and reply."""
+        overhead = self.token_counter.count(self._create_system_prompt() + self._create_user_prompt(''))
+        return max(1000, int(self.token_counter.context_window * self.chunk_fill) - overhead - MAX_OUTPUT_TOKENS)
+    
+    def _split_oversized(self, issue: str, max_tokens: int) -> List[str]:
+        """Split an issue too big for one chunk at comment boundaries, repeating its heading on each part."""
+        heading = issue.split('\n', 1)[0]
+        budget = max_tokens - self.token_counter.count(heading) - 20
         
-        if estimated_tokens <= max_tokens:
-            return [content]
+        # A description or single comment that is itself too big is cut into even slices
+        pieces = []
+        for segment in re.split(r'(?=#### Comment by )', issue):
+            slices = math.ceil(self.token_counter.count(segment) / (budget * 0.9))
+            size = math.ceil(len(segment) / slices)
+            pieces.extend(segment[i:i + size] for i in range(0, len(segment), size))
         
-        # Split by issues (look for ## Issue # pattern)
-        import re
-        issues = re.split(r'(?=## Issue #\d+:)', content)
-        issues = [i for i in issues if i.strip()]
+        parts = [[]]
+        part_tokens = 0
+        for piece in pieces:
+            tokens = self.token_counter.count(piece)
+            if parts[-1] and part_tokens + tokens > budget:
+                parts.append([])
+                part_tokens = 0
+            parts[-1].append(piece)
+            part_tokens += tokens
         
-        chunks = []
-        current_chunk = []
-        current_size = 0
+        parts = [''.join(part) for part in parts]
+        return [parts[0]] + [f"{heading} (continued, part {i}/{len(parts)})\n\n{part}"
+                             for i, part in enumerate(parts[1:], 2)]
+    
+    @staticmethod
+    def _pack(sizes: List[int], capacity: int) -> List[List[int]]:
+        """Pack item sizes into as few bins as first-fit decreasing manages, then even out their loads.
+        
+        Returns each bin's item indexes in their original order, bins ordered by their first item.
+        """
+        order = sorted(range(len(sizes)), key=lambda i: sizes[i], reverse=True)
         
-        for issue in issues:
-            issue_tokens = estimate_tokens(issue)
-            if current_size + issue_tokens > max_tokens and current_chunk:
-                chunks.append('\n'.join(current_chunk))
-                current_chunk = [issue]
-                current_size = issue_tokens
+        bins, loads = [], []
+        for i in order:
+            for b, load in enumerate(loads):
+                if load + sizes[i] <= capacity:
+                    bins[b].append(i)
+                    loads[b] += sizes[i]
+                    break
             else:
-                current_chunk.append(issue)
-                current_size += issue_tokens
+                bins.append([i])
+                loads.append(sizes[i])
+        
+        # Refill the same number of bins largest item first into the emptiest, so no
+        # request is much slower than the rest; keep first-fit's bins if that overflows
+        heap = [(0, b) for b in range(len(bins))]
+        balanced = [[] for _ in bins]
+        for i in order:
+            load, b = heapq.heappop(heap)
+            balanced[b].append(i)
+            heapq.heappush(heap, (load + sizes[i], b))
+        if all(load <= capacity for load, _ in heap):
+            bins = balanced
+        
+        return sorted((sorted(b) for b in bins if b), key=lambda b: b[0])
+    
+    def _chunk_content(self, content: str, max_tokens: Optional[int] = None) -> List[str]:
+        """Split content into as few, evenly sized chunks as fit within token limits."""
+        max_tokens = max_tokens or self._chunk_budget()
+        
+        # Split by issues (look for ## Issue # pattern); each issue's count is cached
+        issues = re.split(r'(?=## Issue #\d+:)', content)
+        issues = [i for i in issues if i.strip()]
+        issue_tokens = [self.token_counter.count(issue) for issue in issues]
+        
+        if sum(issue_tokens) <= max_tokens:
+            return [content]
         
-        if current_chunk:
-            chunks.append('\n'.join(current_chunk))
+        items, sizes = [], []
+        for issue, tokens in zip(issues, issue_tokens):
+            parts = self._split_oversized(issue, max_tokens) if tokens > max_tokens else [issue]
+            items.extend(parts)
+            sizes.extend(self.token_counter.count(part) if len(parts) > 1 else tokens for part in parts)
         
-        return chunks
+        return ['\n'.join(items[i] for i in chunk) for chunk in self._pack(sizes, max_tokens)]
     
     def _call_llm(self, system_prompt: str, user_prompt: str) -> str:
+        """Get the LLM's response, from the cache if this exact request has been made before."""
+        if not self.cache:
+            return self._send(system_prompt, user_prompt)
+        
+        key = self.cache.make_key(self.provider, self.model, system_prompt, user_prompt)
+        response = self.cache.get(key)
+        if response is None:
+            response = self._send(system_prompt, user_prompt)
+            if response:
+                self.cache.store(key, response)
+        return response
+    
+    def _send(self, system_prompt: str, user_prompt: str) -> str:
+        """Make an LLM API call once a concurrency slot and the provider's rate limit allow it."""
+        with self._slots:
+            while True:
+                with self._bucket_lock:
+                    now = time.time()
+                    delay = self._bucket.delay(now)
+                    if delay <= 0:
+                        self._bucket.take(now)
+                        break
+                time.sleep(delay)
+            
+            return self._request_llm(system_prompt, user_prompt)
+    
+    def _request_llm(self, system_prompt: str, user_prompt: str) -> str:
         """Make the actual LLM API call."""
         try:
             if self.provider == 'openai':
@@ -127,7 +264,7 @@ Be concise but comprehensive. Focus on actionable insights."""
                         {"role": "user", "content": user_prompt}
                     ],
                     temperature=0.3,
-                    max_tokens=4000
+                    max_tokens=MAX_OUTPUT_TOKENS
                 )
                 return response.choices[0].message.content
             
@@ -139,14 +276,192 @@ Be concise but comprehensive. Focus on actionable insights."""
                         {"role": "user", "content": user_prompt}
                     ],
                     temperature=0.3,
-                    max_tokens=4000
+                    max_tokens=MAX_OUTPUT_TOKENS
                 )
                 return response.content[0].text
-            
+        
         except Exception as e:
             print_error(f"LLM API error: {e}")
             raise
     
+    def _batch_request(self, custom_id: str, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        """One request line of a batch, in the provider's format."""
+        if self.provider == 'openai':
+            return {
+                'custom_id': custom_id,
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': {
+                    'model': self.model,
+                    'messages': [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    'temperature': 0.3,
+                    'max_tokens': MAX_OUTPUT_TOKENS
+                }
+            }
+        
+        return {
+            'custom_id': custom_id,
+            'params': {
+                'model': self.model,
+                'system': system_prompt,
+                'messages': [{"role": "user", "content": user_prompt}],
+                'temperature': 0.3,
+                'max_tokens': MAX_OUTPUT_TOKENS
+            }
+        }
+    
+    def _submit_batch(self, requests: List[Dict[str, Any]]) -> str:
+        """Submit one batch of requests and return its id."""
+        if self.provider == 'openai':
+            lines = ''.join(json.dumps(request) + '\n' for request in requests)
+            batch_file = self.client.files.create(file=('requests.jsonl', lines.encode('utf-8')), purpose='batch')
+            return self.client.batches.create(
+                input_file_id=batch_file.id, endpoint='/v1/chat/completions', completion_window='24h'
+            ).id
+        
+        return self.client.messages.batches.create(requests=requests).id
+    
+    def _batch_results(self, batch_id: str) -> Optional[Dict[str, str]]:
+        """Responses by custom_id once a batch has ended, or None while it's still running.
+        
+        A batch that failed, expired or was cancelled returns the requests that succeeded.
+        """
+        if self.provider == 'openai':
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status not in OPENAI_BATCH_ENDED:
+                return None
+            if batch.status != 'completed':
+                # Keep whatever finished; the rest are retried one at a time
+                print_warning(f"Batch {batch_id} {batch.status} before all its requests finished")
+            
+            results = {}
+            if batch.output_file_id:
+                for line in self.client.files.content(batch.output_file_id).text.splitlines():
+                    record = json.loads(line)
+                    body = (record.get('response') or {}).get('body') or {}
+                    if body.get('choices'):
+                        results[record['custom_id']] = body['choices'][0]['message']['content']
+            return results
+        
+        if self.client.messages.batches.retrieve(batch_id).processing_status != 'ended':
+            return None
+        return {
+            entry.custom_id: entry.result.message.content[0].text
+            for entry in self.client.messages.batches.results(batch_id)
+            if entry.result.type == 'succeeded'
+        }
+    
+    def _call_llm_batch(self, system_prompt: str, user_prompts: List[str]) -> List[str]:
+        """Send prompts through the provider's batch API, wait for them, and return responses in prompt order.
+        
+        Cached prompts are answered without submitting them. Requests that fail
+        inside an otherwise finished batch are retried one at a time.
+        """
+        keys = [self.cache.make_key(self.provider, self.model, system_prompt, user_prompt) if self.cache else None
+                for user_prompt in user_prompts]
+        responses = [self.cache.get(key) if key else None for key in keys]
+        pending = [i for i, response in enumerate(responses) if response is None]
+        if not pending:
+            return responses
+        
+        # Split into as few batches as the request and size limits allow
+        batches = [[]]
+        batch_bytes = 0
+        for i in pending:
+            request = self._batch_request(f"request-{i}", system_prompt, user_prompts[i])
+            size = len(json.dumps(request).encode('utf-8'))
+            if batches[-1] and (len(batches[-1]) >= BATCH_MAX_REQUESTS or batch_bytes + size > BATCH_MAX_BYTES):
+                batches.append([])
+                batch_bytes = 0
+            batches[-1].append(request)
+            batch_bytes += size
+        
+        batch_ids = [self._submit_batch(requests) for requests in batches]
+        print_info(f"Submitted {len(pending)} request(s) in {len(batch_ids)} batch(es): {', '.join(batch_ids)}")
+        
+        results = {}
+        with create_progress_spinner("Waiting for batches...") as progress:
+            task = progress.add_task(f"Waiting for {len(batch_ids)} batch(es)...", total=len(batch_ids))
+            running = list(batch_ids)
+            while running:
+                for batch_id in list(running):
+                    finished = self._batch_results(batch_id)
+                    if finished is not None:
+                        results.update(finished)
+                        running.remove(batch_id)
+                        progress.update(task, advance=1)
+                if running:
+                    time.sleep(self.batch_poll_interval)
+        
+        failed = [i for i in pending if f"request-{i}" not in results]
+        if failed:
+            print_warning(f"{len(failed)} batch request(s) failed; retrying them directly")
+        
+        for i in pending:
+            response = results.get(f"request-{i}")
+            if response is None:
+                response = self._call_llm(system_prompt, user_prompts[i])
+            elif self.cache:
+                self.cache.store(keys[i], response)
+            responses[i] = response
+        
+        return responses
+    
+    def _create_consolidation_prompt(self, summaries: str, repo_info: str = "") -> str:
+        """Create the prompt that merges partial summaries into one."""
+        return f"""Please create a final, consolidated summary from these partial summaries of GitHub issues{repo_info}.
+
+Combine the insights from all parts into a single, coherent summary following the same structure as before.
+Eliminate any redundancy and provide the most important insights.
+
+Partial Summaries:
+{summaries}"""
+    
+    def _call_llm_many(self, system_prompt: str, user_prompts: List[str], description: str) -> List[str]:
+        """Send prompts concurrently, returning the responses in prompt order."""
+        if self.batch:
+            return self._call_llm_batch(system_prompt, user_prompts)
+        
+        with create_progress_spinner(description) as progress, \
+                ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            task = progress.add_task(description, total=len(user_prompts))
+            
+            def call(user_prompt: str) -> str:
+                response = self._call_llm(system_prompt, user_prompt)
+                progress.update(task, advance=1)
+                return response
+            
+            return list(executor.map(call, user_prompts))
+    
+    def _tree_reduce(self, system_prompt: str, summaries: List[str],
+                     create_prompt: Callable[[str], str]) -> str:
+        """Merge summaries reduce_fan_in at a time, level by level, until one remains.
+        
+        Each level's groups are merged concurrently and no prompt holds more than
+        reduce_fan_in summaries, however many there are to start with.
+        """
+        level = 1
+        while len(summaries) > 1:
+            # Spread summaries evenly over as few groups as the fan-in allows
+            count = -(-len(summaries) // self.reduce_fan_in)
+            groups = [summaries[i * len(summaries) // count:(i + 1) * len(summaries) // count]
+                      for i in range(count)]
+            
+            if count == 1:
+                print_info("Creating final summary...")
+            else:
+                print_info(f"Merging {len(summaries)} summaries into {count} (level {level})...")
+            
+            prompts = [create_prompt("\n\n---\n\n".join(group)) for group in groups if len(group) > 1]
+            merged = iter(self._call_llm_many(system_prompt, prompts, "Merging summaries..."))
+            summaries = [next(merged) if len(group) > 1 else group[0] for group in groups]
+            level += 1
+        
+        return summaries[0]
+    
     def summarize_content(self, content: str, repo_info: str = "") -> str:
         """Summarize issue content using LLM."""
         system_prompt = self._create_system_prompt()
@@ -155,58 +470,69 @@ Be concise but comprehensive. Focus on actionable insights."""
         if len(chunks) == 1:
             # Single chunk - direct summarization
             user_prompt = self._create_user_prompt(chunks[0], repo_info)
+            if self.batch:
+                return self._call_llm_batch(system_prompt, [user_prompt])[0]
             return self._call_llm(system_prompt, user_prompt)
         
         else:
-            # Multiple chunks - hierarchical summarization
+            # Multiple chunks - summarize each concurrently, then merge the summaries as a tree
             print_info(f"Content split into {len(chunks)} chunks for processing")
             
-            chunk_summaries = []
-            with create_progress_spinner("Summarizing chunks...") as progress:
-                task = progress.add_task("Processing chunks...", total=len(chunks))
-                
-                for i, chunk in enumerate(chunks, 1):
-                    user_prompt = self._create_user_prompt(
-                        chunk, 
-                        f" (Part {i}/{len(chunks)}{repo_info})"
-                    )
-                    summary = self._call_llm(system_prompt, user_prompt)
-                    chunk_summaries.append(summary)
-                    progress.update(task, advance=1)
+            user_prompts = [
+                self._create_user_prompt(chunk, f" (Part {i}/{len(chunks)}{repo_info})")
+                for i, chunk in enumerate(chunks, 1)
+            ]
+            chunk_summaries = self._call_llm_many(system_prompt, user_prompts, "Processing chunks...")
             
-            # Create final summary from chunk summaries
-            print_info("Creating final summary from chunks...")
-            combined_summaries = "\n\n---\n\n".join(chunk_summaries)
-            
-            final_prompt = f"""Please create a final, consolidated summary from these partial summaries of GitHub issues{repo_info}.
-            
-Combine the insights from all parts into a single, coherent summary following the same structure as before.
-Eliminate any redundancy and provide the most important insights.
-
-Partial Summaries:
-{combined_summaries}"""
+            return self._tree_reduce(
+                system_prompt, chunk_summaries,
+                lambda summaries: self._create_consolidation_prompt(summaries, repo_info)
+            )
+    
+    def _load_stored_issues(self, store_path: str, owner: str, repo: str) -> List[str]:
+        """Render a repository's open issues from the issue store."""
+        if not Path(store_path).exists():
+            raise FileNotFoundError(f"Issue store not found: {store_path}")
+        
+        store = IssueStore(store_path)
+        try:
+            if not store.has_repo(owner, repo):
+                raise ValueError(f"{owner}/{repo} is not in the issue store {store_path}")
             
-            return self._call_llm(system_prompt, final_prompt)
+            issues = store.load_issues(owner, repo)
+            comments_by_issue = store.load_comments(owner, repo, [issue['number'] for issue in issues])
+        finally:
+            store.close()
+        
+        print_success(f"Loaded {len(issues)} issues from the issue store {store_path}")
+        return [render_issues_markdown(issues, owner, repo, comments_by_issue, show_omitted=True)]
     
     def summarize_repository(self, repo_name: str, issues_dir: str = "issues",
-                           output_dir: str = "summaries") -> str:
-        """Load issue files and create summary."""
+                           output_dir: str = "summaries", store_path: Optional[str] = None) -> str:
+        """Load issues (from the issue store if one is given, else the issue files) and create summary."""
         # Parse repo name if it's in owner_repo format
         if '_' in repo_name:
             owner, repo = repo_name.split('_', 1)
             repo_info = f" for {owner}/{repo}"
         else:
+            owner = repo = None
             repo_info = f" for {repo_name}"
         
-        print_info(f"Loading issue files for {repo_name}...")
-        
-        try:
-            issue_contents = load_issue_files(repo_name, issues_dir)
-        except FileNotFoundError as e:
-            print_error(str(e))
-            raise
-        
-        print_success(f"Loaded {len(issue_contents)} issue file(s)")
+        if store_path:
+            # Only the store is read, so a summary never mixes it with older issue files
+            if not owner:
+                raise ValueError(f"Expected an owner_repo name to read from the issue store, got {repo_name}")
+            issue_contents = self._load_stored_issues(store_path, owner, repo)
+        else:
+            print_info(f"Loading issue files for {repo_name}...")
+            
+            try:
+                issue_contents = load_issue_files(repo_name, issues_dir)
+            except FileNotFoundError as e:
+                print_error(str(e))
+                raise
+            
+            print_success(f"Loaded {len(issue_contents)} issue file(s) from {issues_dir}")
         
         # Combine all issue content
         combined_content = "\n\n".join(issue_contents)
@@ -229,4 +555,75 @@ Partial Summaries:
             f.write(final_content)
         
         print_success(f"Summary saved to {filepath}")
-        return str(filepath)
\ No newline at end of file
+        return str(filepath)
+    
+    def summarize_repositories(self, repo_names: List[str], issues_dir: str = "issues",
+                               output_dir: str = "summaries", store_path: Optional[str] = None,
+                               workers: int = 4) -> Dict[str, str]:
+        """Summarize several repositories, workers at a time, through one LLM client.
+        
+        A repository that fails is reported and skipped. Returns the summary file for
+        each repository that succeeded, in input order.
+        """
+        summaries = {}
+        failed = []
+        
+        with create_progress_spinner("Summarizing repositories...") as progress, \
+                ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            task = progress.add_task(f"Summarized 0/{len(repo_names)} repositories...", total=len(repo_names))
+            futures = {
+                executor.submit(self.summarize_repository, repo_name, issues_dir, output_dir, store_path): repo_name
+                for repo_name in repo_names
+            }
+            
+            for future in as_completed(futures):
+                repo_name = futures[future]
+                try:
+                    summaries[repo_name] = future.result()
+                except Exception as e:
+                    print_error(f"Failed to summarize {repo_name}: {e}")
+                    failed.append(repo_name)
+                
+                done = len(summaries) + len(failed)
+                progress.update(task, advance=1, description=f"Summarized {done}/{len(repo_names)} repositories...")
+        
+        if failed:
+            print_warning(f"{len(failed)} of {len(repo_names)} repositories failed: {', '.join(failed)}")
+        
+        return {repo_name: summaries[repo_name] for repo_name in repo_names if repo_name in summaries}
+    
+    def summarize_organization(self, org: str, summary_files: Dict[str, str],
+                               output_dir: str = "summaries") -> str:
+        """Roll per-repository summaries (repo name -> summary file) up into one organization summary."""
+        system_prompt = self._create_system_prompt()
+        summaries = []
+        for repo_name, summary_file in summary_files.items():
+            with open(summary_file, 'r', encoding='utf-8') as f:
+                summaries.append(f"## {repo_name}\n\n{f.read()}")
+        
+        print_info(f"Rolling up {len(summaries)} repository summaries for {org}...")
+        if len(summaries) == 1:
+            rollup = self._call_llm_many(system_prompt, [self._create_rollup_prompt(summaries[0], org)],
+                                         "Rolling up...")[0]
+        else:
+            rollup = self._tree_reduce(system_prompt, summaries,
+                                       lambda batch: self._create_rollup_prompt(batch, org))
+        
+        output_path = create_output_dir(output_dir)
+        filepath = output_path / f"{org}_org_summary.md"
+        
+        final_content = f"# Summary of GitHub Issues for the {org} organization\n\n"
+        final_content += f"*Generated using {self.provider} ({self.model}) from {len(summaries)} repositories*\n\n"
+        final_content += "---\n\n"
+        final_content += rollup
+        
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(final_content)
+        
+        print_success(f"Organization summary saved to {filepath}")
+        return str(filepath)
+    
+    def close(self):
+        """Close the response cache."""
+        if self.cache:
+            self.cache.close()
\ No newline at end of file
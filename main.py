@@ -2,8 +2,9 @@
 
 import os
 import sys
-from typing import Optional
+from typing import List, Optional, Tuple
 import click
+from click.core import ParameterSource
 from dotenv import load_dotenv
 from pathlib import Path
 
@@ -18,6 +19,109 @@ from utils import (
 load_dotenv()
 
 
+def create_scraper(engine: str, tokens: Tuple[str, ...], comment_workers: int,
+                   cache_dir: Optional[str] = None, page_workers: int = 4,
+                   max_rps: float = 15.0, max_comments: Optional[int] = None,
+                   store_path: Optional[str] = None, repo_workers: int = 1) -> GitHubScraper:
+    """Create a scraper for the selected fetch engine."""
+    options = {
+        'github_tokens': list(tokens),
+        'comment_workers': comment_workers,
+        'page_workers': page_workers,
+        'requests_per_second': max_rps,
+        'max_comments_per_issue': max_comments,
+        'cache_dir': cache_dir,
+        'store_path': store_path,
+        'repo_workers': repo_workers,
+        'cache_max_bytes': int(os.getenv('HTTP_CACHE_MAX_MB', 256)) * 1024 * 1024
+    }
+    
+    if engine == 'async':
+        from async_scraper import AsyncGitHubScraper
+        return AsyncGitHubScraper(**options)
+    return GitHubScraper(**options)
+
+
+def load_repositories(repos_file: Optional[str], org: Optional[str], scraper: GitHubScraper) -> List[str]:
+    """Read repository URLs from a file (one per line, # for comments) or list an organization's."""
+    if bool(repos_file) == bool(org):
+        raise click.UsageError("Give either a file of repository URLs or --org")
+    
+    if org:
+        return scraper.list_org_repositories(org)
+    
+    with open(repos_file, 'r', encoding='utf-8') as f:
+        lines = [line.strip() for line in f]
+    return [line for line in lines if line and not line.startswith('#')]
+
+
+def create_summarizer(provider: Optional[str], model: Optional[str], cache_dir: Optional[str] = None,
+                      batch: bool = False, base_url: Optional[str] = None) -> LLMSummarizer:
+    """Create a summarizer, caching its responses under cache_dir if given."""
+    return LLMSummarizer(
+        provider=provider,
+        model=model,
+        cache_dir=cache_dir,
+        cache_max_bytes=int(os.getenv('LLM_CACHE_MAX_MB', 64)) * 1024 * 1024,
+        max_concurrency=int(os.getenv('LLM_CONCURRENCY', 4)),
+        requests_per_minute=float(os.getenv('LLM_REQUESTS_PER_MINUTE', 0)) or None,
+        reduce_fan_in=int(os.getenv('LLM_REDUCE_FAN_IN', 10)),
+        chunk_fill=float(os.getenv('LLM_CHUNK_FILL', 0.75)),
+        base_url=base_url or os.getenv('LLM_BASE_URL') or None,
+        batch=batch,
+        batch_poll_interval=float(os.getenv('LLM_BATCH_POLL_SECONDS', 30))
+    )
+
+
+def summary_store(store_path: str, no_store: bool) -> Optional[str]:
+    """The issue store a fetch command summarizes from: only one named with --store.
+    
+    By default summaries read the issue files the fetch just wrote, like summarize does.
+    """
+    if no_store or click.get_current_context().get_parameter_source('store_path') == ParameterSource.DEFAULT:
+        return None
+    return store_path
+
+
+def fetch_options(command):
+    """Add the options shared by every command that fetches issues."""
+    options = [
+        click.option('--max-issues', '-m', type=int, help='Maximum number of issues to fetch'),
+        click.option('--max-per-file', type=int, default=50, help='Maximum issues per file'),
+        click.option('--comment-workers', type=int, default=8, help='Concurrent workers for fetching comments'),
+        click.option('--max-comments', type=int, help='Maximum comments to fetch per issue'),
+        click.option('--bulk-comments', is_flag=True,
+                     help='Fetch all comments through the repository-wide endpoint instead of per issue (REST API)'),
+        click.option('--jsonl', 'export_jsonl', is_flag=True,
+                     help='Also write the raw issue and comment JSON as JSONL, appended as pages arrive'),
+        click.option('--parquet', 'export_parquet', is_flag=True,
+                     help='Also write issues and comments as Parquet files (requires pyarrow)'),
+        click.option('--page-workers', type=int, default=4, help='Concurrent requests for fetching issue pages'),
+        click.option('--max-rps', type=float, default=15.0,
+                     help='Maximum GitHub requests per second across all workers (secondary rate limit)'),
+        click.option('--engine', type=click.Choice(['sync', 'async']), default='sync', help='HTTP fetch engine'),
+        click.option('--api', type=click.Choice(['rest', 'graphql', 'search']), default='rest',
+                     help='GitHub API used to fetch issues (graphql embeds comments in bulk queries; '
+                          'search filters out pull requests server-side)'),
+        click.option('--incremental', is_flag=True,
+                     help='Only fetch issues updated since the last incremental run and merge them in'),
+        click.option('--resume', is_flag=True, help='Continue an interrupted fetch from its last checkpoint'),
+        click.option('--pipeline', is_flag=True,
+                     help='Overlap fetching, comment fetching, rendering and writing in bounded stages (sync REST only)'),
+        click.option('--cache-dir', default='results/cache',
+                     help='Directory for the conditional-request HTTP cache (and LLM response cache)'),
+        click.option('--no-cache', is_flag=True, help='Disable the HTTP (and LLM) response caches'),
+        click.option('--store', 'store_path', default='results/issues.sqlite',
+                     help='SQLite database that fetched issues and comments are kept in'),
+        click.option('--no-store', is_flag=True, help='Do not keep fetched issues in the local database'),
+        click.option('--token', 'tokens', multiple=True,
+                     help='GitHub personal access token (overrides env var; repeat to pool several tokens)')
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
 @click.group()
 @click.version_option(version='1.0.0', prog_name='GitHub Issues Analyzer')
 def cli():
@@ -28,13 +132,14 @@ def cli():
 @cli.command()
 @click.argument('repo_url')
 @click.option('--output-dir', '-o', default='results/issues', help='Output directory for issue files')
-@click.option('--max-issues', '-m', type=int, help='Maximum number of issues to fetch')
-@click.option('--max-per-file', type=int, default=50, help='Maximum issues per file')
 @click.option('--no-comments', is_flag=True, help='Skip fetching comments')
-@click.option('--token', help='GitHub personal access token (overrides env var)')
+@fetch_options
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
 def fetch_issues(repo_url: str, output_dir: str, max_issues: Optional[int],
-                max_per_file: int, no_comments: bool, token: Optional[str], verbose: bool):
+                max_per_file: int, no_comments: bool, comment_workers: int, max_comments: Optional[int],
+                bulk_comments: bool, export_jsonl: bool, export_parquet: bool, page_workers: int, max_rps: float,
+                engine: str, api: str, incremental: bool, resume: bool, pipeline: bool, cache_dir: str, no_cache: bool,
+                store_path: str, no_store: bool, tokens: Tuple[str, ...], verbose: bool):
     """Fetch GitHub issues and save to markdown files.
     
     REPO_URL: GitHub repository URL (e.g., https://github.com/owner/repo)
@@ -52,8 +157,15 @@ def fetch_issues(repo_url: str, output_dir: str, max_issues: Optional[int],
         
         # Create scraper and fetch issues
         try:
-            scraper = GitHubScraper(github_token=token)
-        except ValueError as e:
+            scraper = create_scraper(
+                engine, tokens, comment_workers,
+                cache_dir=None if no_cache else cache_dir,
+                page_workers=page_workers,
+                max_rps=max_rps,
+                max_comments=max_comments,
+                store_path=None if no_store else store_path
+            )
+        except (ValueError, ImportError) as e:
             print_error(str(e))
             sys.exit(1)
         
@@ -61,8 +173,17 @@ def fetch_issues(repo_url: str, output_dir: str, max_issues: Optional[int],
             repo_url,
             output_dir=output_dir,
             max_issues=max_issues,
-            max_issues_per_file=max_per_file
+            max_issues_per_file=max_per_file,
+            fetch_comments=not no_comments,
+            api=api,
+            incremental=incremental,
+            resume=resume,
+            bulk_comments=bulk_comments,
+            export_jsonl=export_jsonl,
+            export_parquet=export_parquet,
+            pipeline=pipeline
         )
+        scraper.close()
         
         if saved_files:
             print_success(f"Successfully saved {len(saved_files)} file(s)")
@@ -71,7 +192,7 @@ def fetch_issues(repo_url: str, output_dir: str, max_issues: Optional[int],
                     print_info(f"  - {file}")
         else:
             print_warning("No issues were saved")
-        
+    
     except Exception as e:
         print_error(f"Failed to fetch issues: {e}")
         sys.exit(1)
@@ -83,9 +204,17 @@ def fetch_issues(repo_url: str, output_dir: str, max_issues: Optional[int],
 @click.option('--output-dir', '-o', default='results/summaries', help='Output directory for summaries')
 @click.option('--provider', type=click.Choice(['openai', 'anthropic']), help='LLM provider')
 @click.option('--model', help='Specific model to use')
+@click.option('--batch', is_flag=True,
+              help="Send prompts through the provider's discounted batch API and wait for the results")
+@click.option('--base-url', help='LLM API base URL (e.g. a proxy or a local stand-in server)')
+@click.option('--cache-dir', default='results/cache', help='Directory for the LLM response cache')
+@click.option('--no-cache', is_flag=True, help='Always call the LLM, without reading or writing the response cache')
+@click.option('--store', 'store_path',
+              help='Summarize from this issue database instead of the issue files in --issues-dir')
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
 def summarize(repo_name: str, issues_dir: str, output_dir: str,
-             provider: Optional[str], model: Optional[str], verbose: bool):
+             provider: Optional[str], model: Optional[str], batch: bool, base_url: Optional[str],
+             cache_dir: str, no_cache: bool, store_path: Optional[str], verbose: bool):
     """Summarize existing issue files using AI.
     
     REPO_NAME: Repository name (e.g., owner_repo or as saved in issue files)
@@ -95,17 +224,19 @@ def summarize(repo_name: str, issues_dir: str, output_dir: str,
             print_info(f"Starting summarization for: {repo_name}")
         
         # Create summarizer and generate summary
-        summarizer = LLMSummarizer(provider=provider, model=model)
+        summarizer = create_summarizer(provider, model, None if no_cache else cache_dir, batch, base_url)
         summary_file = summarizer.summarize_repository(
             repo_name,
             issues_dir=issues_dir,
-            output_dir=output_dir
+            output_dir=output_dir,
+            store_path=store_path
         )
+        summarizer.close()
         
         print_success(f"Summary generated successfully")
         if verbose:
             print_info(f"Summary saved to: {summary_file}")
-        
+    
     except Exception as e:
         print_error(f"Failed to summarize issues: {e}")
         sys.exit(1)
@@ -115,16 +246,18 @@ def summarize(repo_name: str, issues_dir: str, output_dir: str,
 @click.argument('repo_url')
 @click.option('--issues-dir', default='results/issues', help='Directory for issue files')
 @click.option('--summaries-dir', default='results/summaries', help='Directory for summary files')
-@click.option('--max-issues', '-m', type=int, help='Maximum number of issues to fetch')
-@click.option('--max-per-file', type=int, default=50, help='Maximum issues per file')
 @click.option('--provider', type=click.Choice(['openai', 'anthropic']), help='LLM provider')
 @click.option('--model', help='Specific model to use')
-@click.option('--token', help='GitHub personal access token')
+@fetch_options
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
 def fetch_and_summarize(repo_url: str, issues_dir: str, summaries_dir: str,
                        max_issues: Optional[int], max_per_file: int,
                        provider: Optional[str], model: Optional[str],
-                       token: Optional[str], verbose: bool):
+                       comment_workers: int, max_comments: Optional[int], bulk_comments: bool,
+                       export_jsonl: bool, export_parquet: bool, page_workers: int, max_rps: float,
+                       engine: str, api: str, incremental: bool, resume: bool, pipeline: bool,
+                       cache_dir: str, no_cache: bool, store_path: str, no_store: bool,
+                       tokens: Tuple[str, ...], verbose: bool):
     """Fetch GitHub issues and generate AI summary.
     
     REPO_URL: GitHub repository URL (e.g., https://github.com/owner/repo)
@@ -141,8 +274,15 @@ def fetch_and_summarize(repo_url: str, issues_dir: str, summaries_dir: str,
             max_per_file = int(os.getenv('MAX_ISSUES_PER_FILE', 50))
         
         try:
-            scraper = GitHubScraper(github_token=token)
-        except ValueError as e:
+            scraper = create_scraper(
+                engine, tokens, comment_workers,
+                cache_dir=None if no_cache else cache_dir,
+                page_workers=page_workers,
+                max_rps=max_rps,
+                max_comments=max_comments,
+                store_path=None if no_store else store_path
+            )
+        except (ValueError, ImportError) as e:
             print_error(str(e))
             sys.exit(1)
         
@@ -150,8 +290,16 @@ def fetch_and_summarize(repo_url: str, issues_dir: str, summaries_dir: str,
             repo_url,
             output_dir=issues_dir,
             max_issues=max_issues,
-            max_issues_per_file=max_per_file
+            max_issues_per_file=max_per_file,
+            api=api,
+            incremental=incremental,
+            resume=resume,
+            bulk_comments=bulk_comments,
+            export_jsonl=export_jsonl,
+            export_parquet=export_parquet,
+            pipeline=pipeline
         )
+        scraper.close()
         
         if not saved_files:
             print_warning("No issues found. Exiting.")
@@ -162,31 +310,275 @@ def fetch_and_summarize(repo_url: str, issues_dir: str, summaries_dir: str,
         # Step 2: Generate summary
         print_info("\nStep 2: Generating AI summary...")
         
-        summarizer = LLMSummarizer(provider=provider, model=model)
+        summarizer = create_summarizer(provider, model, None if no_cache else cache_dir)
         summary_file = summarizer.summarize_repository(
             repo_name,
             issues_dir=issues_dir,
-            output_dir=summaries_dir
+            output_dir=summaries_dir,
+            store_path=summary_store(store_path, no_store)
         )
+        summarizer.close()
         
         print_success("\n✨ Process completed successfully!")
         print_info(f"Issues saved to: {issues_dir}/")
         print_info(f"Summary saved to: {summary_file}")
-        
+    
     except Exception as e:
         print_error(f"Process failed: {e}")
         sys.exit(1)
 
 
+@cli.command('fetch-many')
+@click.argument('repos_file', required=False, type=click.Path(exists=True, dir_okay=False))
+@click.option('--org', help='Fetch every repository in this GitHub organization instead of a file')
+@click.option('--output-dir', '-o', default='results/issues', help='Output directory for issue files')
+@click.option('--repo-workers', type=int, default=4, help='Repositories fetched at once')
+@click.option('--no-comments', is_flag=True, help='Skip fetching comments')
+@fetch_options
+@click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+def fetch_many(repos_file: Optional[str], org: Optional[str], output_dir: str, repo_workers: int,
+               no_comments: bool, max_issues: Optional[int], max_per_file: int, comment_workers: int,
+               max_comments: Optional[int], bulk_comments: bool, export_jsonl: bool, export_parquet: bool,
+               page_workers: int, max_rps: float, engine: str, api: str, incremental: bool, resume: bool,
+               pipeline: bool, cache_dir: str, no_cache: bool, store_path: str, no_store: bool,
+               tokens: Tuple[str, ...], verbose: bool):
+    """Fetch issues for many repositories through one shared connection pool and rate limiter.
+    
+    REPOS_FILE: File with one GitHub repository URL (or owner/repo) per line
+    """
+    try:
+        if max_per_file == 50:
+            max_per_file = int(os.getenv('MAX_ISSUES_PER_FILE', 50))
+        
+        try:
+            scraper = create_scraper(
+                engine, tokens, comment_workers,
+                cache_dir=None if no_cache else cache_dir,
+                page_workers=page_workers,
+                max_rps=max_rps,
+                max_comments=max_comments,
+                store_path=None if no_store else store_path,
+                repo_workers=repo_workers
+            )
+        except (ValueError, ImportError) as e:
+            print_error(str(e))
+            sys.exit(1)
+        
+        repo_urls = load_repositories(repos_file, org, scraper)
+        print_info(f"Fetching issues for {len(repo_urls)} repositories, {repo_workers} at a time...")
+        
+        saved = scraper.save_repositories(
+            repo_urls,
+            output_dir=output_dir,
+            repo_workers=repo_workers,
+            max_issues=max_issues,
+            max_issues_per_file=max_per_file,
+            fetch_comments=not no_comments,
+            api=api,
+            incremental=incremental,
+            resume=resume,
+            bulk_comments=bulk_comments,
+            export_jsonl=export_jsonl,
+            export_parquet=export_parquet,
+            pipeline=pipeline
+        )
+        scraper.close()
+        
+        file_count = sum(len(files) for files in saved.values())
+        print_success(f"Saved {file_count} file(s) for {len(saved)} of {len(repo_urls)} repositories")
+        if verbose:
+            for repo_url, files in saved.items():
+                print_info(f"  - {repo_url}: {len(files)} file(s)")
+        
+        if len(saved) < len(repo_urls):
+            sys.exit(1)
+    
+    except click.UsageError:
+        raise
+    except Exception as e:
+        print_error(f"Failed to fetch issues: {e}")
+        sys.exit(1)
+
+
+@cli.command('summarize-many')
+@click.argument('repos_file', required=False, type=click.Path(exists=True, dir_okay=False))
+@click.option('--org', help='Summarize every repository in this GitHub organization instead of a file')
+@click.option('--issues-dir', '-i', default='results/issues', help='Directory containing issue files')
+@click.option('--output-dir', '-o', default='results/summaries', help='Output directory for summaries')
+@click.option('--provider', type=click.Choice(['openai', 'anthropic']), help='LLM provider')
+@click.option('--model', help='Specific model to use')
+@click.option('--repo-workers', type=int, default=4, help='Repositories summarized at once')
+@click.option('--batch', is_flag=True,
+              help="Send prompts through the provider's discounted batch API and wait for the results")
+@click.option('--base-url', help='LLM API base URL (e.g. a proxy or a local stand-in server)')
+@click.option('--cache-dir', default='results/cache', help='Directory for the LLM response cache')
+@click.option('--no-cache', is_flag=True, help='Always call the LLM, without reading or writing the response cache')
+@click.option('--store', 'store_path',
+              help='Summarize from this issue database instead of the issue files in --issues-dir')
+@click.option('--token', 'tokens', multiple=True,
+              help='GitHub personal access token for listing --org repositories (repeat to pool several tokens)')
+@click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+def summarize_many(repos_file: Optional[str], org: Optional[str], issues_dir: str, output_dir: str,
+                   provider: Optional[str], model: Optional[str], repo_workers: int, batch: bool,
+                   base_url: Optional[str], cache_dir: str, no_cache: bool, store_path: Optional[str], tokens: Tuple[str, ...], verbose: bool):
+    """Summarize already fetched issues for many repositories using AI.
+    
+    REPOS_FILE: File with one GitHub repository URL (or owner/repo) per line
+    """
+    try:
+        scraper = None
+        if org:
+            try:
+                scraper = create_scraper('sync', tokens, 1)
+            except ValueError as e:
+                print_error(str(e))
+                sys.exit(1)
+        
+        repo_urls = load_repositories(repos_file, org, scraper)
+        if scraper:
+            scraper.close()
+        repo_names = [get_repo_filename(*parse_github_url(repo_url)) for repo_url in repo_urls]
+        
+        summarizer = create_summarizer(provider, model, None if no_cache else cache_dir, batch, base_url)
+        summaries = summarizer.summarize_repositories(
+            repo_names,
+            issues_dir=issues_dir,
+            output_dir=output_dir,
+            store_path=store_path,
+            workers=repo_workers
+        )
+        summarizer.close()
+        
+        print_success(f"Generated {len(summaries)} of {len(repo_names)} summaries")
+        if verbose:
+            for summary_file in summaries.values():
+                print_info(f"  - {summary_file}")
+        
+        if len(summaries) < len(repo_names):
+            sys.exit(1)
+    
+    except click.UsageError:
+        raise
+    except Exception as e:
+        print_error(f"Failed to summarize issues: {e}")
+        sys.exit(1)
+
+
+@cli.command('fetch-org')
+@click.argument('org')
+@click.option('--issues-dir', default='results/issues', help='Directory for issue files')
+@click.option('--summaries-dir', default='results/summaries', help='Directory for summary files')
+@click.option('--provider', type=click.Choice(['openai', 'anthropic']), help='LLM provider')
+@click.option('--model', help='Specific model to use')
+@click.option('--repo-workers', type=int, default=4,
+              help='Repositories fetched (and summarized) at once across the organization')
+@click.option('--include-inactive', is_flag=True, help='Also fetch archived, empty and issue-less repositories')
+@click.option('--no-summary', is_flag=True, help='Only fetch issues, without the AI summaries')
+@fetch_options
+@click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+def fetch_org(org: str, issues_dir: str, summaries_dir: str, provider: Optional[str], model: Optional[str],
+              repo_workers: int, include_inactive: bool, no_summary: bool, max_issues: Optional[int],
+              max_per_file: int, comment_workers: int, max_comments: Optional[int], bulk_comments: bool,
+              export_jsonl: bool, export_parquet: bool, page_workers: int, max_rps: float, engine: str,
+              api: str, incremental: bool, resume: bool, pipeline: bool, cache_dir: str, no_cache: bool,
+              store_path: str, no_store: bool, tokens: Tuple[str, ...], verbose: bool):
+    """Fetch issues for every repository in an organization and summarize them, per repository and overall.
+    
+    ORG: GitHub organization name (e.g., my-org)
+    """
+    try:
+        # Step 1: Fetch issues
+        print_info(f"Step 1: Fetching issues for the {org} organization...")
+        
+        if max_per_file == 50:
+            max_per_file = int(os.getenv('MAX_ISSUES_PER_FILE', 50))
+        
+        try:
+            scraper = create_scraper(
+                engine, tokens, comment_workers,
+                cache_dir=None if no_cache else cache_dir,
+                page_workers=page_workers,
+                max_rps=max_rps,
+                max_comments=max_comments,
+                store_path=None if no_store else store_path,
+                repo_workers=repo_workers
+            )
+        except (ValueError, ImportError) as e:
+            print_error(str(e))
+            sys.exit(1)
+        
+        repo_urls = scraper.list_org_repositories(org, include_inactive=include_inactive)
+        if not repo_urls:
+            print_warning(f"No repositories to fetch in {org}. Exiting.")
+            scraper.close()
+            return
+        print_info(f"Fetching issues for {len(repo_urls)} repositories, {repo_workers} at a time...")
+        
+        saved = scraper.save_repositories(
+            repo_urls,
+            output_dir=issues_dir,
+            repo_workers=repo_workers,
+            max_issues=max_issues,
+            max_issues_per_file=max_per_file,
+            api=api,
+            incremental=incremental,
+            resume=resume,
+            bulk_comments=bulk_comments,
+            export_jsonl=export_jsonl,
+            export_parquet=export_parquet,
+            pipeline=pipeline
+        )
+        scraper.close()
+        
+        # Repositories without open issues have nothing to summarize
+        repo_names = [get_repo_filename(*parse_github_url(repo_url)) for repo_url, files in saved.items() if files]
+        print_success(f"Fetched issues for {len(saved)} of {len(repo_urls)} repositories, "
+                      f"{len(repo_names)} with open issues")
+        
+        if no_summary or not repo_names:
+            return
+        
+        # Step 2: Summarize each repository, then roll those up for the organization
+        print_info("\nStep 2: Generating AI summaries...")
+        
+        summarizer = create_summarizer(provider, model, None if no_cache else cache_dir)
+        summaries = summarizer.summarize_repositories(
+            repo_names,
+            issues_dir=issues_dir,
+            output_dir=summaries_dir,
+            store_path=summary_store(store_path, no_store),
+            workers=repo_workers
+        )
+        if not summaries:
+            print_error("No repository summaries were generated")
+            sys.exit(1)
+        
+        org_summary = summarizer.summarize_organization(org, summaries, output_dir=summaries_dir)
+        summarizer.close()
+        
+        print_success("\n✨ Process completed successfully!")
+        print_info(f"Issues saved to: {issues_dir}/")
+        print_info(f"Organization summary saved to: {org_summary}")
+        if verbose:
+            for summary_file in summaries.values():
+                print_info(f"  - {summary_file}")
+    
+    except Exception as e:
+        print_error(f"Process failed: {e}")
+        sys.exit(1)
+
 
 @cli.command()
 def check_config():
     """Check configuration and API keys."""
     print_info("Checking configuration...\n")
     
-    # Check GitHub token
+    # Check GitHub token(s)
+    github_tokens = [t for t in os.getenv('GITHUB_TOKENS', '').split(',') if t.strip()]
     github_token = os.getenv('GITHUB_TOKEN')
-    if github_token:
+    if github_tokens:
+        print_success(f"✓ {len(github_tokens)} GitHub token(s) configured via GITHUB_TOKENS")
+    elif github_token:
         print_success("✓ GitHub token configured")
     else:
         print_error("✗ GitHub token not found (REQUIRED)")
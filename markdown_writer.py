@@ -0,0 +1,97 @@
+import math
+import os
+import shutil
+from typing import Dict, List, Optional
+
+from utils import (
+    create_output_dir, get_repo_filename, render_markdown_header, render_issue_markdown,
+    print_success
+)
+
+
+class MarkdownWriter:
+    """Stream rendered issues straight to markdown files, starting a new file every max_issues_per_file.
+    
+    Only the issue being written is held in memory, however large the repository.
+    When the total isn't known up front, each file's body is spooled to a .part
+    file and its header (which states the issue count) is added once it's full.
+    """
+    
+    def __init__(self, output_dir: str, owner: str, repo: str, total_issues: Optional[int] = None,
+                 max_issues_per_file: int = 50, show_omitted: bool = False):
+        self.output_path = create_output_dir(output_dir)
+        self.owner = owner
+        self.repo = repo
+        self.total_issues = total_issues
+        self.max_issues_per_file = max_issues_per_file
+        self.show_omitted = show_omitted
+        self.file_count = math.ceil(total_issues / max_issues_per_file) if total_issues is not None else None
+        self.saved_files = []
+        self._file = None
+        self._filepath = None
+        self._part_path = None
+        self._index = 0
+        self._written = 0
+        self._in_file = 0
+    
+    def _filename(self, index: int, single: bool) -> str:
+        if single:
+            return f"{get_repo_filename(self.owner, self.repo, 'issues')}.md"
+        return f"{get_repo_filename(self.owner, self.repo, f'issues_{index}')}.md"
+    
+    def _open_next(self):
+        """Close the current file and start the next one with its header."""
+        self._close_current()
+        self._index += 1
+        
+        if self.total_issues is None:
+            self._part_path = self.output_path / (self._filename(self._index, False) + '.part')
+            self._file = open(self._part_path, 'w', encoding='utf-8')
+        else:
+            self._filepath = self.output_path / self._filename(self._index, self.file_count == 1)
+            self._file = open(self._filepath, 'w', encoding='utf-8')
+            issue_count = min(self.max_issues_per_file, self.total_issues - self._written)
+            self._file.write(render_markdown_header(self.owner, self.repo, issue_count))
+    
+    def _close_current(self, last: bool = False):
+        if not self._file:
+            return
+        
+        self._file.close()
+        if self.total_issues is None:
+            # Now the count is known: write the header, then the spooled body after it
+            self._filepath = self.output_path / self._filename(self._index, last and self._index == 1)
+            with open(self._filepath, 'w', encoding='utf-8') as f, \
+                    open(self._part_path, 'r', encoding='utf-8') as part:
+                f.write(render_markdown_header(self.owner, self.repo, self._in_file))
+                shutil.copyfileobj(part, f)
+            os.remove(self._part_path)
+        
+        self.saved_files.append(str(self._filepath))
+        print_success(f"Saved {self._in_file} issues to {self._filepath}")
+        self._file = None
+        self._in_file = 0
+    
+    def write_issue(self, issue: Dict, comments: Optional[List[Dict]] = None):
+        """Render one issue (with its comments, if they were fetched) and append it to the current file."""
+        self.write_markdown(render_issue_markdown(issue, comments, self.show_omitted))
+    
+    def write_markdown(self, markdown: str):
+        """Append one already rendered issue to the current file."""
+        if self._file is None or self._in_file >= self.max_issues_per_file:
+            self._open_next()
+        
+        self._file.write(markdown)
+        self._written += 1
+        self._in_file += 1
+    
+    def close(self) -> List[str]:
+        """Finish the last file; returns every file written."""
+        self._close_current(last=True)
+        return self.saved_files
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
\ No newline at end of file
@@ -0,0 +1,206 @@
+import queue
+import threading
+from typing import Dict, List, Optional
+
+from checkpoint import FetchCheckpoint
+from export import JSONLExporter
+from markdown_writer import MarkdownWriter
+from utils import create_progress_spinner, render_issue_markdown
+
+# Marks the end of a stage's output
+DONE = object()
+
+# Issues written to the issue store per transaction
+STORE_BATCH = 100
+
+
+class IssuePipeline:
+    """Fetch, render and write a repository's issues in overlapping stages.
+    
+    Stages run in their own threads and are joined by bounded queues:
+        
+        page fetcher -> comment fetchers (comment_workers) -> renderer -> writer
+    
+    Network, CPU and disk work overlap. A full queue stalls the stage that feeds
+    it, and a stalled page fetcher has at most page_workers pages in flight, so
+    memory holds about `queue_size` issues between fetch and write whatever the
+    repository's size. Issues are written in the order they were listed.
+    """
+    
+    def __init__(self, scraper, owner: str, repo: str, output_dir: str,
+                 max_issues: Optional[int] = None, max_issues_per_file: int = 50,
+                 fetch_comments: bool = True, checkpoint: Optional[FetchCheckpoint] = None,
+                 exporter: Optional[JSONLExporter] = None, queue_size: int = 200):
+        self.scraper = scraper
+        self.owner = owner
+        self.repo = repo
+        self.output_dir = output_dir
+        self.max_issues = max_issues
+        self.max_issues_per_file = max_issues_per_file
+        self.fetch_comments = fetch_comments
+        self.checkpoint = checkpoint
+        self.exporter = exporter
+        self.queue_size = queue_size
+        
+        self._issues = queue.Queue(maxsize=queue_size)
+        self._fetched = queue.Queue(maxsize=queue_size)
+        self._rendered = queue.Queue(maxsize=queue_size)
+        
+        # Out-of-order comment results wait in the renderer; this caps how many can
+        self._window = threading.Semaphore(queue_size)
+        self._errors = []
+        self._saved_comments = {}
+        self.listing_complete = False
+    
+    def _stage(self, target, *args):
+        """Start a stage thread that records any error instead of dying silently."""
+        def run():
+            try:
+                target(*args)
+            except Exception as e:
+                self._errors.append(e)
+        
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+    
+    def _fetch_pages(self):
+        """Stage 1: list issues page by page, numbering them in listing order."""
+        sequence = 0
+        self.scraper.start_listing()
+        try:
+            for page_issues in self.scraper.iter_issue_pages(
+                self.owner, self.repo, self.max_issues,
+                checkpoint=self.checkpoint, exporter=self.exporter
+            ):
+                for issue in page_issues:
+                    if self.max_issues and sequence >= self.max_issues:
+                        return
+                    # Wait for the writer to catch up, unless another stage has failed
+                    while not self._window.acquire(timeout=0.5):
+                        if self._errors:
+                            return
+                    self._issues.put((sequence, issue))
+                    sequence += 1
+        finally:
+            self.listing_complete = not self.scraper.listing_interrupted()
+            for _ in range(self.scraper.comment_workers):
+                self._issues.put(DONE)
+    
+    def _fetch_comments(self):
+        """Stage 2: fetch each issue's comments (one of comment_workers threads)."""
+        try:
+            while True:
+                item = self._issues.get()
+                if item is DONE:
+                    return
+                
+                sequence, issue = item
+                comments = None
+                if self.fetch_comments:
+                    comments = self._comments_for(issue)
+                self._fetched.put((sequence, issue, comments))
+        finally:
+            self._fetched.put(DONE)
+    
+    def _comments_for(self, issue: Dict) -> List[Dict]:
+        number = issue['number']
+        if issue.get('comments', 0) == 0:
+            return []
+        if number in self._saved_comments:
+            return self._saved_comments[number]
+        
+        comments = self.scraper.try_fetch_comments(self.owner, self.repo, number)
+        return self.scraper.record_comments(number, comments, self.checkpoint, self.exporter)
+    
+    def _render(self):
+        """Stage 3: restore listing order and render each issue to markdown."""
+        show_omitted = bool(self.scraper.max_comments_per_issue)
+        pending = {}
+        next_sequence = 0
+        workers_done = 0
+        
+        try:
+            while workers_done < self.scraper.comment_workers:
+                item = self._fetched.get()
+                if item is DONE:
+                    workers_done += 1
+                    continue
+                
+                pending[item[0]] = item
+                while next_sequence in pending:
+                    _, issue, comments = pending.pop(next_sequence)
+                    markdown = render_issue_markdown(issue, comments, show_omitted)
+                    self._rendered.put((issue, comments, markdown))
+                    next_sequence += 1
+            
+            # Only reached with gaps if a comment worker failed; keep what did arrive
+            for sequence in sorted(pending):
+                _, issue, comments = pending[sequence]
+                self._rendered.put((issue, comments, render_issue_markdown(issue, comments, show_omitted)))
+        finally:
+            self._rendered.put(DONE)
+    
+    def run(self) -> List[str]:
+        """Run every stage to completion; stage 4 (writing) runs on the calling thread.
+        
+        Returns the files written.
+        """
+        if self.checkpoint:
+            self._saved_comments = self.checkpoint.load_comments()
+        
+        threads = [self._stage(self._fetch_pages)]
+        threads += [self._stage(self._fetch_comments) for _ in range(self.scraper.comment_workers)]
+        threads.append(self._stage(self._render))
+        
+        store = self.scraper.store
+        batch = []
+        listed = []
+        written = 0
+        writer = MarkdownWriter(
+            self.output_dir, self.owner, self.repo, max_issues_per_file=self.max_issues_per_file,
+            show_omitted=bool(self.scraper.max_comments_per_issue)
+        )
+        
+        with create_progress_spinner("Fetching and writing issues...") as progress, writer:
+            task = progress.add_task("Fetching and writing issues...", total=None)
+            
+            while True:
+                item = self._rendered.get()
+                if item is DONE:
+                    break
+                
+                issue, comments, markdown = item
+                writer.write_markdown(markdown)
+                self._window.release()
+                written += 1
+                progress.update(task, description=f"Wrote {written} issues...")
+                
+                if store:
+                    listed.append({'number': issue['number'], 'created_at': issue['created_at']})
+                    batch.append((issue, comments))
+                    if len(batch) >= STORE_BATCH:
+                        self._store_batch(batch)
+                        batch = []
+            
+            if store and batch:
+                self._store_batch(batch)
+        
+        # A failed stage can leave the ones feeding it blocked on a full queue; they're daemons
+        if not self._errors:
+            for thread in threads:
+                thread.join()
+        if self._errors:
+            raise self._errors[0]
+        
+        # Stored issues this listing no longer contains have closed since an earlier run
+        if store and self.listing_complete:
+            self.scraper.close_unlisted(self.owner, self.repo, listed, capped=bool(self.max_issues))
+        
+        return writer.saved_files
+    
+    def _store_batch(self, batch: List):
+        """Upsert a batch of written issues (and their comments, if fetched) into the issue store."""
+        issues = [issue for issue, _ in batch]
+        comments_by_issue = {issue['number']: comments for issue, comments in batch} if self.fetch_comments else None
+        self.scraper.store.upsert_issues(self.owner, self.repo, issues, comments_by_issue)
\ No newline at end of file
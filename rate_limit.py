@@ -0,0 +1,178 @@
+import threading
+import time
+from typing import Dict, List, Optional, Mapping, Tuple
+
+# GitHub's hourly primary limit for an authenticated token, assumed until a response says otherwise
+DEFAULT_LIMIT = 5000
+
+# Once a token is down to this fraction of its limit, spread what's left evenly until the reset
+PACE_BELOW_FRACTION = 0.1
+
+
+class TokenPool:
+    """Route requests to the GitHub token with the most rate limit headroom."""
+    
+    def __init__(self, tokens: List[str]):
+        self.tokens = list(dict.fromkeys(token for token in tokens if token))
+        if not self.tokens:
+            raise ValueError("At least one GitHub token is required")
+        
+        self._lock = threading.Lock()
+        self._limits = {}
+    
+    def _limit(self, token: str, resource: str) -> Dict:
+        """Rate limit state for a token on one API resource (core, graphql, search)."""
+        return self._limits.setdefault(
+            (token, resource),
+            {'limit': DEFAULT_LIMIT, 'remaining': None, 'reset': 0.0, 'in_flight': 0, 'last_sent': 0.0}
+        )
+    
+    @staticmethod
+    def _headroom(limit: Dict, now: float) -> int:
+        """Requests a token can still make, less those already in flight."""
+        remaining = limit['remaining']
+        if remaining is None or limit['reset'] <= now:
+            # A new window starts with the resource's full limit (e.g. 30 for search), once known
+            remaining = limit['limit']
+        return remaining - limit['in_flight']
+    
+    @staticmethod
+    def _pace_delay(limit: Dict, headroom: int, now: float) -> float:
+        """Seconds until a nearly exhausted token may send again without running dry before reset."""
+        if limit['remaining'] is None or limit['reset'] <= now:
+            return 0
+        if headroom > limit['limit'] * PACE_BELOW_FRACTION:
+            return 0
+        
+        interval = (limit['reset'] - now) / max(headroom, 1)
+        return max(0, limit['last_sent'] + interval - now)
+    
+    def acquire(self, resource: str = 'core') -> Tuple[Optional[str], float]:
+        """Reserve the token with the most headroom.
+        
+        Returns the token and 0, or None and the number of seconds to wait
+        when every token is exhausted or being paced.
+        """
+        now = time.time()
+        
+        with self._lock:
+            limits = {token: self._limit(token, resource) for token in self.tokens}
+            token = max(self.tokens, key=lambda t: self._headroom(limits[t], now))
+            limit = limits[token]
+            headroom = self._headroom(limit, now)
+            
+            if headroom > 0:
+                delay = self._pace_delay(limit, headroom, now)
+                if delay > 0:
+                    return None, delay
+                
+                limit['in_flight'] += 1
+                limit['last_sent'] = now
+                return token, 0
+            
+            resets = [limit['reset'] for limit in limits.values()
+                      if limit['remaining'] == 0 and limit['reset'] > now]
+            if len(resets) == len(limits):
+                return None, min(resets) - now + 1
+            
+            # Headroom is only taken by in-flight requests, which will report back shortly
+            return None, 1.0
+    
+    def release(self, token: str, resource: str = 'core',
+                headers: Optional[Mapping[str, str]] = None):
+        """Return a reservation and record the rate limit headers GitHub sent back."""
+        with self._lock:
+            limit = self._limit(token, resource)
+            limit['in_flight'] = max(0, limit['in_flight'] - 1)
+            
+            if not headers or 'X-RateLimit-Remaining' not in headers:
+                return
+            
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset = float(headers.get('X-RateLimit-Reset', 0))
+            limit['limit'] = int(headers.get('X-RateLimit-Limit', limit['limit']))
+            
+            # Concurrent responses can arrive out of order; keep the lowest count in a window
+            if reset == limit['reset'] and limit['remaining'] is not None:
+                remaining = min(remaining, limit['remaining'])
+            
+            limit['remaining'] = remaining
+            limit['reset'] = reset
+
+
+class TokenBucket:
+    """Allow `rate` requests per second on average, with bursts of up to `capacity`."""
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = time.time()
+    
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def delay(self, now: float) -> float:
+        """Seconds until a request may be sent."""
+        self._refill(now)
+        return 0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+    
+    def take(self, now: float):
+        """Spend one request."""
+        self._refill(now)
+        self.tokens -= 1
+
+
+class RequestScheduler:
+    """Pace GitHub requests across a token pool so they stay under primary and secondary limits.
+    
+    Primary (hourly, per token) limits are tracked by the TokenPool from the
+    headers of every response. Secondary limits are global: a token bucket
+    caps the request rate, a counter caps concurrent requests, and a
+    Retry-After (or secondary limit 403) pauses every worker at once.
+    """
+    
+    def __init__(self, pool: TokenPool, requests_per_second: float = 15.0,
+                 max_concurrency: int = 50):
+        self.pool = pool
+        self.bucket = TokenBucket(requests_per_second, capacity=max(1.0, requests_per_second))
+        self.max_concurrency = max(1, max_concurrency)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._pause_until = 0.0
+    
+    def acquire(self, resource: str = 'core') -> Tuple[Optional[str], float]:
+        """Reserve a token for one request, or return None and the seconds to wait first."""
+        now = time.time()
+        
+        with self._lock:
+            if self._pause_until > now:
+                return None, self._pause_until - now
+            
+            if self._in_flight >= self.max_concurrency:
+                return None, 0.05
+            
+            delay = self.bucket.delay(now)
+            if delay > 0:
+                return None, delay
+            
+            token, delay = self.pool.acquire(resource)
+            if token is None:
+                return None, delay
+            
+            self.bucket.take(now)
+            self._in_flight += 1
+            return token, 0
+    
+    def release(self, token: str, resource: str = 'core',
+                headers: Optional[Mapping[str, str]] = None):
+        """Finish a request and feed its rate limit headers back to the pool."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+        self.pool.release(token, resource, headers)
+    
+    def pause(self, seconds: float):
+        """Hold every request for the given number of seconds."""
+        with self._lock:
+            self._pause_until = max(self._pause_until, time.time() + seconds)
\ No newline at end of file
@@ -0,0 +1,92 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+class SQLiteLRUStore:
+    """A size-capped SQLite table of values by key that evicts the least recently used rows first.
+    
+    Each row holds a key, the value columns it was created with, the value's
+    size in bytes and when it was last used.
+    """
+    
+    def __init__(self, path: Path, table: str, columns: Dict[str, str], max_bytes: int):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self.table = table
+        self.columns = list(columns)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        
+        column_defs = ''.join(f'{name} {definition}, ' for name, definition in columns.items())
+        self._conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS {table} (
+                key TEXT PRIMARY KEY,
+                {column_defs}
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )
+        ''')
+        self._conn.execute(f'CREATE INDEX IF NOT EXISTS {table}_last_used ON {table} (last_used)')
+        self._conn.commit()
+        
+        self._total_bytes = self._conn.execute(f'SELECT COALESCE(SUM(size), 0) FROM {table}').fetchone()[0]
+    
+    def get(self, key: str) -> Optional[Tuple]:
+        """Return a key's value columns and mark it as recently used."""
+        with self._lock:
+            row = self._conn.execute(
+                f'SELECT {", ".join(self.columns)} FROM {self.table} WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            self._conn.execute(f'UPDATE {self.table} SET last_used = ? WHERE key = ?', (time.time(), key))
+            self._conn.commit()
+        
+        return row
+    
+    def put(self, key: str, values: Tuple, size: int):
+        """Store a key's value columns, evicting the least recently used rows as needed."""
+        if size > self.max_bytes:
+            return
+        
+        with self._lock:
+            row = self._conn.execute(f'SELECT size FROM {self.table} WHERE key = ?', (key,)).fetchone()
+            if row:
+                self._total_bytes -= row[0]
+            
+            placeholders = ', '.join('?' * (len(self.columns) + 3))
+            self._conn.execute(
+                f'INSERT OR REPLACE INTO {self.table} (key, {", ".join(self.columns)}, size, last_used) '
+                f'VALUES ({placeholders})',
+                (key, *values, size, time.time())
+            )
+            self._total_bytes += size
+            self._evict()
+            self._conn.commit()
+    
+    def _evict(self):
+        """Drop least recently used rows until the table fits in max_bytes."""
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                f'SELECT key, size FROM {self.table} ORDER BY last_used LIMIT 100'
+            ).fetchall()
+            if not rows:
+                break
+            
+            for key, size in rows:
+                self._conn.execute(f'DELETE FROM {self.table} WHERE key = ?', (key,))
+                self._total_bytes -= size
+                if self._total_bytes <= self.max_bytes:
+                    break
+    
+    def close(self):
+        """Close the underlying database."""
+        with self._lock:
+            self._conn.close()
\ No newline at end of file
@@ -0,0 +1,132 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs, urlparse
+
+
+def make_issue(number: int, comments: int = 0) -> Dict:
+    """An open issue in the REST API's shape."""
+    return {
+        'number': number,
+        'title': f'Issue {number}',
+        'body': f'Body of issue {number}',
+        'state': 'open',
+        'user': {'login': 'author'},
+        'labels': [],
+        'assignees': [],
+        'comments': comments,
+        'created_at': f'2024-01-01T00:{number // 60 % 60:02d}:{number % 60:02d}Z',
+        'updated_at': f'2024-02-01T00:{number // 60 % 60:02d}:{number % 60:02d}Z',
+        'html_url': f'https://github.com/o/r/issues/{number}'
+    }
+
+
+def make_comments(number: int, count: int) -> List[Dict]:
+    """An issue's comment thread in the REST API's shape."""
+    return [{
+        'id': number * 1000 + i,
+        'user': {'login': 'commenter'},
+        'body': f'Comment {i} on issue {number}',
+        'created_at': '2024-01-02T00:00:00Z',
+        'updated_at': '2024-01-02T00:00:00Z'
+    } for i in range(count)]
+
+
+class FakeGitHub:
+    """A local stand-in for the parts of the GitHub REST API the scraper lists issues and comments with.
+    
+    Every request path is recorded in `requests`. `threads` overrides an issue's
+    comment thread by number. Comment responses wait for
+    `comments_gate` to be set, and requests (path and query) matching a pattern
+    in `failures` get a 500 response.
+    """
+    
+    def __init__(self, issues: List[Dict]):
+        self.issues = issues
+        self.requests = []
+        self.failures = []
+        self.threads = {}
+        self.comments_gate = threading.Event()
+        self.comments_gate.set()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+    
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self._server.server_address[1]}'
+    
+    def start(self) -> str:
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.url
+    
+    def stop(self):
+        self.comments_gate.set()
+        self._server.shutdown()
+        self._server.server_close()
+    
+    def count(self, pattern: str) -> int:
+        """Number of requests so far whose path matches a pattern."""
+        with self._lock:
+            return sum(1 for path in self.requests if re.search(pattern, path))
+    
+    def _respond(self, request_path: str):
+        """Return (status, body, headers) for a request."""
+        if any(re.search(pattern, request_path) for pattern in self.failures):
+            return 500, {'message': 'Server Error'}, {}
+        
+        url = urlparse(request_path)
+        path, query = url.path, parse_qs(url.query)
+        match = re.fullmatch(r'/repos/o/r/issues/(\d+)/comments', path)
+        if match:
+            self.comments_gate.wait()
+            number = int(match.group(1))
+            issue = next(issue for issue in self.issues if issue['number'] == number)
+            thread = self.threads.get(number, make_comments(number, issue['comments']))
+            return self._page(thread, path, query)
+        
+        if path == '/repos/o/r/issues':
+            return self._page([issue for issue in self.issues if issue['state'] == 'open'], path, query)
+        
+        return 404, {'message': 'Not Found'}, {}
+    
+    def _page(self, items: List[Dict], path: str, query: Dict[str, List[str]]):
+        """One page of a listing, with the Link header GitHub paginates with."""
+        per_page = int(query.get('per_page', ['30'])[0])
+        page = int(query.get('page', ['1'])[0])
+        last_page = max(1, -(-len(items) // per_page))
+        
+        links = []
+        if page < last_page:
+            links.append(f'<{self.url}{path}?per_page={per_page}&page={page + 1}>; rel="next"')
+        links.append(f'<{self.url}{path}?per_page={per_page}&page={last_page}>; rel="last"')
+        return 200, items[(page - 1) * per_page:page * per_page], {'Link': ', '.join(links)}
+    
+    def _handler(self):
+        fake = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+            
+            def do_GET(self):
+                with fake._lock:
+                    fake.requests.append(self.path)
+                
+                status, body, headers = fake._respond(self.path)
+                payload = json.dumps(body).encode('utf-8')
+                
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.send_header('X-RateLimit-Limit', '5000')
+                self.send_header('X-RateLimit-Remaining', '4999')
+                self.send_header('X-RateLimit-Reset', '9999999999')
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+        
+        return Handler
\ No newline at end of file
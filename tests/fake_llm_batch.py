@@ -0,0 +1,159 @@
+import json
+import re
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+
+def answer(prompt: str) -> str:
+    """The stand-in model's response to a prompt."""
+    return f'Answer to: {prompt}'
+
+
+class FakeBatchAPI:
+    """A local stand-in for the OpenAI and Anthropic batch APIs.
+    
+    A batch finishes once it has been polled `polls_until_done` times. OpenAI
+    batches then end with `end_status`, and requests whose custom_id is in
+    `failures` come back as errors. Results are returned in reverse order, so
+    callers have to match them by custom_id.
+    """
+    
+    def __init__(self):
+        self.batches = {}
+        self.files = {}
+        self.failures = set()
+        self.end_status = 'completed'
+        self.polls_until_done = 2
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+    
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self._server.server_address[1]}'
+    
+    def start(self) -> str:
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.url
+    
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+    
+    def _openai_batch(self, batch_id: str) -> Dict:
+        batch = self.batches[batch_id]
+        done = batch['polls'] >= self.polls_until_done
+        output_file_id = None
+        
+        if done:
+            lines = []
+            for request in reversed(batch['requests']):
+                if request['custom_id'] in self.failures:
+                    response = {'status_code': 500, 'body': {'error': {'message': 'Server Error'}}}
+                else:
+                    content = answer(request['body']['messages'][1]['content'])
+                    response = {'status_code': 200, 'body': {'choices': [{'message': {'role': 'assistant', 'content': content}}]}}
+                lines.append({'custom_id': request['custom_id'], 'response': response, 'error': None})
+            output_file_id = f'file-output-{batch_id}'
+            self.files[output_file_id] = ''.join(json.dumps(line) + '\n' for line in lines)
+        
+        return {
+            'id': batch_id, 'object': 'batch', 'endpoint': '/v1/chat/completions', 'input_file_id': batch['input_file_id'],
+            'completion_window': '24h', 'created_at': 0,
+            'status': self.end_status if done else 'in_progress', 'output_file_id': output_file_id
+        }
+    
+    def _anthropic_batch(self, batch_id: str) -> Dict:
+        done = self.batches[batch_id]['polls'] >= self.polls_until_done
+        return {
+            'id': batch_id, 'type': 'message_batch', 'processing_status': 'ended' if done else 'in_progress',
+            'request_counts': {'processing': 0, 'succeeded': 0, 'errored': 0, 'canceled': 0, 'expired': 0},
+            'created_at': '2024-01-01T00:00:00Z', 'expires_at': '2024-01-02T00:00:00Z', 'ended_at': None,
+            'archived_at': None, 'cancel_initiated_at': None,
+            'results_url': f'{self.url}/v1/messages/batches/{batch_id}/results' if done else None
+        }
+    
+    def _anthropic_results(self, batch_id: str) -> List[Dict]:
+        results = []
+        for request in reversed(self.batches[batch_id]['requests']):
+            if request['custom_id'] in self.failures:
+                result = {'type': 'errored', 'error': {'type': 'error', 'error': {'type': 'api_error', 'message': 'Server Error'}}}
+            else:
+                content = answer(request['params']['messages'][0]['content'])
+                result = {'type': 'succeeded', 'message': {
+                    'id': 'msg', 'type': 'message', 'role': 'assistant', 'model': request['params']['model'],
+                    'stop_reason': 'end_turn', 'stop_sequence': None, 'usage': {'input_tokens': 1, 'output_tokens': 1},
+                    'content': [{'type': 'text', 'text': content}]
+                }}
+            results.append({'custom_id': request['custom_id'], 'result': result})
+        return results
+    
+    def _handler(self):
+        fake = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+            
+            def send(self, body, raw: bytes = None):
+                payload = raw if raw is not None else json.dumps(body).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+            
+            def read_body(self) -> bytes:
+                return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            
+            def do_POST(self):
+                if self.path == '/v1/files':
+                    # The request file is the one multipart part with a filename
+                    boundary = self.headers['Content-Type'].split('boundary=')[1].encode()
+                    part = next(p for p in self.read_body().split(b'--' + boundary) if b'filename=' in p)
+                    content = part.split(b'\r\n\r\n', 1)[1].rsplit(b'\r\n', 1)[0]
+                    file_id = f'file-{uuid.uuid4().hex[:8]}'
+                    fake.files[file_id] = content.decode('utf-8')
+                    return self.send({'id': file_id, 'object': 'file', 'bytes': len(content), 'created_at': 0,
+                                      'filename': 'requests.jsonl', 'purpose': 'batch', 'status': 'processed'})
+                
+                if self.path == '/v1/batches':
+                    request = json.loads(self.read_body())
+                    batch_id = f'batch_{uuid.uuid4().hex[:8]}'
+                    fake.batches[batch_id] = {
+                        'input_file_id': request['input_file_id'], 'polls': 0,
+                        'requests': [json.loads(line) for line in fake.files[request['input_file_id']].splitlines()]
+                    }
+                    return self.send(fake._openai_batch(batch_id))
+                
+                if self.path == '/v1/messages/batches':
+                    batch_id = f'msgbatch_{uuid.uuid4().hex[:8]}'
+                    fake.batches[batch_id] = {'requests': json.loads(self.read_body())['requests'], 'polls': 0}
+                    return self.send(fake._anthropic_batch(batch_id))
+                
+                self.send_error(404)
+            
+            def do_GET(self):
+                match = re.fullmatch(r'/v1/batches/([^/]+)', self.path)
+                if match:
+                    fake.batches[match.group(1)]['polls'] += 1
+                    return self.send(fake._openai_batch(match.group(1)))
+                
+                match = re.fullmatch(r'/v1/files/([^/]+)/content', self.path)
+                if match:
+                    return self.send(None, raw=fake.files[match.group(1)].encode('utf-8'))
+                
+                match = re.fullmatch(r'/v1/messages/batches/([^/]+)/results', self.path)
+                if match:
+                    lines = fake._anthropic_results(match.group(1))
+                    return self.send(None, raw=''.join(json.dumps(line) + '\n' for line in lines).encode('utf-8'))
+                
+                match = re.fullmatch(r'/v1/messages/batches/([^/]+)', self.path)
+                if match:
+                    fake.batches[match.group(1)]['polls'] += 1
+                    return self.send(fake._anthropic_batch(match.group(1)))
+                
+                self.send_error(404)
+        
+        return Handler
\ No newline at end of file
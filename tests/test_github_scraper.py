@@ -0,0 +1,113 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from tenacity import wait_none
+
+from async_scraper import AsyncGitHubScraper
+from checkpoint import FetchCheckpoint
+from fake_github import FakeGitHub, make_issue
+from github_scraper import GitHubScraper
+from issue_store import IssueStore
+
+ENGINES = [('github_scraper', GitHubScraper), ('async_scraper', AsyncGitHubScraper)]
+
+
+class FailedRequestTest(unittest.TestCase):
+    """Requests that keep failing are reported and skipped rather than aborting the fetch."""
+    
+    def setUp(self):
+        # Retry immediately so exhausted retries don't slow the tests down
+        for patcher in (patch.object(GitHubScraper._make_request.retry, 'wait', wait_none()),
+                        patch.object(AsyncGitHubScraper._make_request_async.retry, 'wait', wait_none())):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        
+        self.github = FakeGitHub([make_issue(number, comments=2) for number in range(250, 0, -1)])
+        self.base_url = self.github.start()
+        self.addCleanup(self.github.stop)
+        self.output_dir = tempfile.mkdtemp()
+    
+    def scraper(self, engine, **options):
+        scraper = engine('token', requests_per_second=1000, **options)
+        scraper.base_url = self.base_url
+        self.addCleanup(scraper.close)
+        return scraper
+    
+    def test_failed_comment_fetch_is_skipped(self):
+        self.github.failures.append(r'/issues/5/comments')
+        
+        for module, engine in ENGINES:
+            with self.subTest(engine=engine.__name__), patch(f'{module}.print_warning') as warning:
+                files = self.scraper(engine).save_issues('o/r', output_dir=self.output_dir, max_issues_per_file=5000)
+                
+                markdown = Path(files[0]).read_text(encoding='utf-8')
+                self.assertEqual(markdown.count('## Issue #'), 250)
+                self.assertRegex(markdown, r'Comment 0 on issue 6\n')
+                self.assertNotRegex(markdown, r'Comment 0 on issue 5\n')
+                self.assertTrue(any('#5' in call.args[0] for call in warning.call_args_list))
+    
+    def test_failed_listing_page_closes_nothing(self):
+        """Issues on pages a failed listing never reached stay open in the store until a full listing."""
+        for _, engine in ENGINES:
+            with self.subTest(engine=engine.__name__):
+                store_path = str(Path(tempfile.mkdtemp()) / 'issues.sqlite')
+                self.github.failures.clear()
+                for issue in self.github.issues:
+                    issue['state'] = 'open'
+                self.scraper(engine, store_path=store_path).save_issues(
+                    'o/r', output_dir=self.output_dir, fetch_comments=False
+                )
+                
+                # Issue 20 closes, but the listing fails before reaching its page
+                self.github.issues[-20]['state'] = 'closed'
+                self.github.failures.append(r'/repos/o/r/issues\?.*page=2')
+                with patch('github_scraper.print_error') as error:
+                    files = self.scraper(engine, store_path=store_path).save_issues(
+                        'o/r', output_dir=self.output_dir, fetch_comments=False
+                    )
+                self.assertTrue(files)
+                self.assertTrue(any('Error fetching issues' in call.args[0] for call in error.call_args_list))
+                self.assertEqual(len(self.open_issues(store_path)), 250)
+                
+                self.github.failures.clear()
+                self.scraper(engine, store_path=store_path).save_issues(
+                    'o/r', output_dir=self.output_dir, fetch_comments=False
+                )
+                open_issues = self.open_issues(store_path)
+                self.assertEqual(len(open_issues), 249)
+                self.assertNotIn(20, open_issues)
+    
+    def test_resume_retries_only_failed_comment_fetches(self):
+        """Empty threads are checkpointed like any other; only failed fetches are repeated on resume."""
+        issues = [make_issue(number, comments=2) for number in (7, 6, 5)]
+        self.github.threads[7] = []
+        self.github.failures.append(r'/issues/5/comments')
+        
+        for _, engine in ENGINES:
+            with self.subTest(engine=engine.__name__):
+                directory = Path(tempfile.mkdtemp()) / 'checkpoint'
+                checkpoint = FetchCheckpoint(directory, {})
+                checkpoint.start()
+                comments = self.scraper(engine).prefetch_comments('o', 'r', issues, checkpoint)
+                self.assertEqual({number: len(thread) for number, thread in comments.items()}, {7: 0, 6: 2, 5: 0})
+                
+                before = {number: self.github.count(rf'/issues/{number}/comments') for number in (7, 6, 5)}
+                checkpoint = FetchCheckpoint(directory, {})
+                self.assertTrue(checkpoint.start(resume=True))
+                self.scraper(engine).prefetch_comments('o', 'r', issues, checkpoint)
+                self.assertEqual(self.github.count(r'/issues/7/comments'), before[7])
+                self.assertEqual(self.github.count(r'/issues/6/comments'), before[6])
+                self.assertGreater(self.github.count(r'/issues/5/comments'), before[5])
+    
+    def open_issues(self, store_path):
+        store = IssueStore(store_path)
+        try:
+            return {issue['number'] for issue in store.load_issues('o', 'r')}
+        finally:
+            store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
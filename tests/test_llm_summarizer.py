@@ -0,0 +1,77 @@
+import os
+import unittest
+from unittest.mock import patch
+
+import llm_summarizer
+from fake_llm_batch import FakeBatchAPI, answer
+from llm_summarizer import LLMSummarizer
+
+PROVIDERS = [('openai', 'gpt-4o-mini', '/v1'), ('anthropic', 'claude-3-5-haiku-latest', '')]
+
+
+class BatchTest(unittest.TestCase):
+    """The batch path's submit / poll / result protocol, against a local stand-in batch API."""
+    
+    def setUp(self):
+        self.api = FakeBatchAPI()
+        base_url = self.api.start()
+        self.addCleanup(self.api.stop)
+        
+        self.direct = []
+        patcher = patch.object(LLMSummarizer, '_request_llm', lambda _, system, user: self.direct.append(user) or answer(user))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        env = patch.dict(os.environ, {'OPENAI_API_KEY': 'key', 'ANTHROPIC_API_KEY': 'key'})
+        env.start()
+        self.addCleanup(env.stop)
+        
+        self.summarizers = {}
+        for provider, model, path in PROVIDERS:
+            summarizer = LLMSummarizer(provider=provider, model=model, base_url=base_url + path,
+                                       batch=True, batch_poll_interval=0.01)
+            self.addCleanup(summarizer.close)
+            self.summarizers[provider] = summarizer
+        
+        self.prompts = [f'Part {i}' for i in range(5)]
+    
+    def test_completed_batch(self):
+        """Results come back out of order and are matched to their prompts by custom_id."""
+        for provider, summarizer in self.summarizers.items():
+            with self.subTest(provider=provider):
+                self.direct.clear()
+                responses = summarizer._call_llm_batch('system', self.prompts)
+                self.assertEqual(responses, [answer(prompt) for prompt in self.prompts])
+                self.assertEqual(self.direct, [])
+    
+    def test_failed_requests_are_retried_directly(self):
+        self.api.failures = {'request-1', 'request-3'}
+        for provider, summarizer in self.summarizers.items():
+            with self.subTest(provider=provider):
+                self.direct.clear()
+                responses = summarizer._call_llm_batch('system', self.prompts)
+                self.assertEqual(responses, [answer(prompt) for prompt in self.prompts])
+                self.assertEqual(self.direct, ['Part 1', 'Part 3'])
+    
+    def test_expired_batch_keeps_partial_output(self):
+        """An OpenAI batch that expires keeps what finished; only the rest is sent directly."""
+        self.api.end_status = 'expired'
+        self.api.failures = {'request-2'}
+        with patch('llm_summarizer.print_warning') as warning:
+            responses = self.summarizers['openai']._call_llm_batch('system', self.prompts)
+        
+        self.assertEqual(responses, [answer(prompt) for prompt in self.prompts])
+        self.assertEqual(self.direct, ['Part 2'])
+        self.assertTrue(any('expired' in call.args[0] for call in warning.call_args_list))
+    
+    def test_requests_split_across_batches(self):
+        for provider, summarizer in self.summarizers.items():
+            with self.subTest(provider=provider), patch.object(llm_summarizer, 'BATCH_MAX_REQUESTS', 2):
+                self.api.batches.clear()
+                responses = summarizer._call_llm_batch('system', self.prompts)
+                self.assertEqual(responses, [answer(prompt) for prompt in self.prompts])
+                self.assertEqual(len(self.api.batches), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,49 @@
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from fake_github import FakeGitHub, make_issue
+from github_scraper import GitHubScraper
+from pipeline import IssuePipeline
+
+
+class IssuePipelineTest(unittest.TestCase):
+    def setUp(self):
+        # 1,000 issues with one comment each: ten pages of 100
+        self.github = FakeGitHub([make_issue(number, comments=1) for number in range(1000, 0, -1)])
+        self.scraper = GitHubScraper('token', comment_workers=2, page_workers=3, requests_per_second=1000)
+        self.scraper.base_url = self.github.start()
+        self.output_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        self.github.stop()
+        self.scraper.close()
+    
+    def test_stalled_writer_stops_page_fetches(self):
+        """While comments (and so writing) are stalled, only the pages that fill the queues are fetched."""
+        self.github.comments_gate.clear()
+        pipeline = IssuePipeline(self.scraper, 'o', 'r', self.output_dir, max_issues_per_file=5000, queue_size=150)
+        result = {}
+        runner = threading.Thread(target=lambda: result.update(files=pipeline.run()))
+        runner.start()
+        
+        time.sleep(1)
+        # The queues take 150 issues, so the fetcher stalls on the second page; at
+        # most page_workers pages are requested ahead of it
+        stalled_pages = self.github.count(r'^/repos/o/r/issues\?')
+        self.assertLessEqual(stalled_pages, 1 + self.scraper.page_workers)
+        
+        self.github.comments_gate.set()
+        runner.join(timeout=60)
+        self.assertFalse(runner.is_alive())
+        
+        self.assertEqual(self.github.count(r'^/repos/o/r/issues\?'), 10)
+        markdown = Path(result['files'][0]).read_text(encoding='utf-8')
+        self.assertEqual(markdown.count('## Issue #'), 1000)
+        self.assertLess(markdown.index('## Issue #1000:'), markdown.index('## Issue #999:'))
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,24 @@
+import time
+import unittest
+
+from rate_limit import DEFAULT_LIMIT, TokenPool
+
+
+class TokenPoolTest(unittest.TestCase):
+    def test_new_window_uses_the_learned_limit(self):
+        """After a reset, a resource's headroom is the limit its headers reported, not the core default."""
+        pool = TokenPool(['token'])
+        self.assertEqual(pool.acquire('search'), ('token', 0))
+        pool.release('token', 'search', {
+            'X-RateLimit-Limit': '30',
+            'X-RateLimit-Remaining': '29',
+            'X-RateLimit-Reset': str(time.time() - 1)
+        })
+        
+        limit = pool._limit('token', 'search')
+        self.assertEqual(TokenPool._headroom(limit, time.time()), 30)
+        self.assertEqual(TokenPool._headroom(pool._limit('token', 'core'), time.time()), DEFAULT_LIMIT)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,99 @@
+import math
+import re
+from functools import lru_cache
+from typing import Optional
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Input context windows by model name prefix; the longest matching prefix wins
+MODEL_CONTEXT_WINDOWS = {
+    'gpt-3.5-turbo': 16385,
+    'gpt-4': 8192,
+    'gpt-4-turbo': 128000,
+    'gpt-4o': 128000,
+    'gpt-4.1': 1047576,
+    'gpt-5': 272000,
+    'o1': 200000,
+    'o3': 200000,
+    'o4': 200000,
+    'claude': 200000,
+}
+DEFAULT_CONTEXT_WINDOW = 128000
+
+# Per-script token rates for models without a local tokenizer: most English words (with
+# their leading space) are one token, which works out at the ~3.5 characters per token
+# Anthropic documents for prose; symbols, indentation and CJK text are much denser.
+CHARS_PER_WORD_TOKEN = 6
+TOKENS_PER_SYMBOL = 0.7
+TOKENS_PER_INDENT = 1
+TOKENS_PER_CJK_CHAR = 1.2
+TOKENS_PER_OTHER_CHAR = 0.5
+
+# Issues (and other texts) whose counts are remembered
+COUNT_CACHE_SIZE = 65536
+
+_PIECES = re.compile(
+    r'(?P<word>[A-Za-z0-9_]+)'
+    r'|(?P<cjk>[⺀-鿿가-힯豈-﫿＀-￯])'
+    r'|(?P<space>\s+)'
+    r'|(?P<symbol>[\x21-\x7e])'
+    r'|(?P<other>.)',
+    re.DOTALL
+)
+
+
+def context_window(model: Optional[str]) -> int:
+    """Input context window of a model, in tokens."""
+    prefixes = [prefix for prefix in MODEL_CONTEXT_WINDOWS if model and model.startswith(prefix)]
+    if not prefixes:
+        return DEFAULT_CONTEXT_WINDOW
+    return MODEL_CONTEXT_WINDOWS[max(prefixes, key=len)]
+
+
+def estimate_tokens_by_script(text: str) -> float:
+    """Estimate a token count from the mix of words, symbols and CJK characters in text."""
+    tokens = 0.0
+    for match in _PIECES.finditer(text):
+        kind = match.lastgroup
+        if kind == 'word':
+            tokens += math.ceil(len(match.group()) / CHARS_PER_WORD_TOKEN)
+        elif kind == 'cjk':
+            tokens += TOKENS_PER_CJK_CHAR
+        elif kind == 'space' and len(match.group()) > 1:
+            tokens += TOKENS_PER_INDENT
+        elif kind == 'symbol':
+            tokens += TOKENS_PER_SYMBOL
+        elif kind == 'other':
+            tokens += TOKENS_PER_OTHER_CHAR
+    return tokens
+
+
+class TokenCounter:
+    """Count tokens the way a provider's model does.
+    
+    OpenAI models are counted exactly with tiktoken when it's installed; other
+    models (and OpenAI without tiktoken) use a per-script estimate. Counts are
+    cached, so re-chunking the same issues doesn't tokenize them again.
+    """
+    
+    def __init__(self, provider: str, model: Optional[str] = None):
+        self.provider = provider
+        self.model = model
+        self.context_window = context_window(model)
+        self.encoding = None
+        
+        if provider == 'openai' and tiktoken is not None:
+            try:
+                self.encoding = tiktoken.encoding_for_model(model or '')
+            except KeyError:
+                self.encoding = tiktoken.get_encoding('o200k_base')
+        
+        self.count = lru_cache(maxsize=COUNT_CACHE_SIZE)(self._count)
+    
+    def _count(self, text: str) -> int:
+        if self.encoding is not None:
+            return len(self.encoding.encode(text, disallowed_special=()))
+        return math.ceil(estimate_tokens_by_script(text))
\ No newline at end of file
@@ -1,7 +1,11 @@
 import os
 import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -12,7 +16,7 @@ console = Console()
 def parse_github_url(url: str) -> Tuple[str, str]:
     """Extract owner and repo name from GitHub URL."""
     patterns = [
-        r'github\.com[/:]([^/]+)/([^/\.]+)',
+        r'github\.com[/:]([^/]+)/([^/?#]+)',
         r'([^/]+)/([^/]+)$'
     ]
     
@@ -20,7 +24,8 @@ def parse_github_url(url: str) -> Tuple[str, str]:
         match = re.search(pattern, url)
         if match:
             owner, repo = match.groups()
-            repo = repo.replace('.git', '')
+            # Only a clone URL's suffix; names like .github or gitops.git-tools keep theirs
+            repo = re.sub(r'\.git$', '', repo)
             return owner, repo
     
     raise ValueError(f"Invalid GitHub URL: {url}")
@@ -49,6 +54,27 @@ def split_into_chunks(items: List, chunk_size: int) -> List[List]:
     return chunks
 
 
+def map_in_order(executor: Executor, fn: Callable, items: Iterable, window: int) -> Iterator[Tuple[Any, Any]]:
+    """Yield (item, fn(item)) in order, with at most `window` calls submitted ahead of the consumer.
+    
+    Unlike executor.map, nothing more is submitted while the consumer is busy,
+    so a stalled consumer stops the work (and the memory its results hold) too.
+    """
+    pending = deque()
+    try:
+        for item in items:
+            pending.append((item, executor.submit(fn, item)))
+            if len(pending) >= window:
+                item, future = pending.popleft()
+                yield item, future.result()
+        while pending:
+            item, future = pending.popleft()
+            yield item, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+
 def format_datetime(dt_str: str) -> str:
     """Format ISO datetime string to readable format."""
     try:
@@ -72,12 +98,6 @@ def clean_markdown_content(content: str) -> str:
     return content.strip()
 
 
-def estimate_tokens(text: str) -> int:
-    """Rough estimate of token count for text."""
-    # Rough approximation: 1 token ≈ 4 characters
-    return len(text) // 4
-
-
 def load_issue_files(repo_name: str, issues_dir: str = "issues") -> List[str]:
     """Load all issue markdown files for a repository."""
     issues_path = Path(issues_dir)
@@ -103,13 +123,90 @@ def load_issue_files(repo_name: str, issues_dir: str = "issues") -> List[str]:
     return contents
 
 
+def render_markdown_header(owner: str, repo: str, issue_count: int) -> str:
+    """Render the heading of an issues markdown document."""
+    return (
+        f"# GitHub Issues for {owner}/{repo}\n\n"
+        f"*Generated on {format_datetime(time.strftime('%Y-%m-%dT%H:%M:%SZ'))}*\n\n"
+        f"**Total Open Issues:** {issue_count}\n\n"
+        "---\n\n"
+    )
+
+
+def render_issue_markdown(issue: Dict, comments: Optional[List[Dict]] = None,
+                          show_omitted: bool = False) -> str:
+    """Render one issue, and its comments if they were fetched, as markdown."""
+    # Issue header
+    markdown_parts = [f"## Issue #{issue['number']}: {issue['title']}\n\n"]
+    
+    # Metadata
+    markdown_parts.append(f"**Author:** {issue['user']['login']}\n")
+    markdown_parts.append(f"**Created:** {format_datetime(issue['created_at'])}\n")
+    
+    if issue.get('updated_at'):
+        markdown_parts.append(f"**Updated:** {format_datetime(issue['updated_at'])}\n")
+    
+    if issue.get('labels'):
+        labels = ', '.join([label['name'] for label in issue['labels']])
+        markdown_parts.append(f"**Labels:** {labels}\n")
+    
+    if issue.get('assignees'):
+        assignees = ', '.join([a['login'] for a in issue['assignees']])
+        markdown_parts.append(f"**Assignees:** {assignees}\n")
+    
+    markdown_parts.append("\n")
+    
+    # Issue description
+    markdown_parts.append("### Description\n\n")
+    description = clean_markdown_content(issue.get('body', 'No description provided.'))
+    markdown_parts.append(f"{description}\n\n")
+    
+    # Add prefetched comments
+    if comments and issue.get('comments', 0) > 0:
+        markdown_parts.append("### Comments\n\n")
+        for comment in comments:
+            author = comment['user']['login']
+            created = format_datetime(comment['created_at'])
+            body = clean_markdown_content(comment.get('body', ''))
+            
+            markdown_parts.append(f"#### Comment by {author} ({created})\n\n")
+            markdown_parts.append(f"{body}\n\n")
+        
+        # Threads cut off by a per-issue comment cap
+        omitted = issue['comments'] - len(comments)
+        if show_omitted and omitted > 0:
+            markdown_parts.append(f"*{omitted} more comments not shown*\n\n")
+    
+    markdown_parts.append("---\n\n")
+    return ''.join(markdown_parts)
+
+
+def render_issues_markdown(issues: List[Dict], owner: str, repo: str,
+                           comments_by_issue: Optional[Dict[int, List[Dict]]] = None,
+                           show_omitted: bool = False) -> str:
+    """Render issues, and their comments if given, as a markdown document."""
+    markdown_parts = [render_markdown_header(owner, repo, len(issues))]
+    
+    with create_progress_spinner("Processing issues...") as progress:
+        task = progress.add_task("Processing issues...", total=len(issues))
+        
+        for issue in issues:
+            comments = comments_by_issue.get(issue['number'], []) if comments_by_issue is not None else None
+            markdown_parts.append(render_issue_markdown(issue, comments, show_omitted))
+            progress.update(task, advance=1)
+    
+    return ''.join(markdown_parts)
+
+
 def create_progress_spinner(description: str) -> Progress:
     """Create a progress spinner for long-running operations."""
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
-        transient=True
+        transient=True,
+        # Rich can only show one live display at a time, so spinners only run on the main thread
+        disable=threading.current_thread() is not threading.main_thread()
     )
 
 